@@ -0,0 +1,163 @@
+# benchmarks/bench_backends.py — Cross-Backend Conformance & Throughput
+# Every hypercomplex kernel on NumPy/torch-CPU × float64/float32 against an independent einsum float64 reference,
+# plus zero-copy and autograd checks, then products/s per backend and dtype, then the quaternion
+# examples against their pre-dispatch hand-written Hamilton formulas (baseline: slowdown ratio per case)
+# Run: python -m benchmarks.bench_backends [--batch 65536] [--skip-bench]
+# The same conformance, zero-copy and autograd checks run in CI as tests/test_backend.py
+# Dependencies: numpy (torch optional — torch rows skipped when absent)
+
+import argparse
+import time
+import timeit
+
+import numpy as np
+
+from quantum_mega_hybrid_v7.backend import get_backend, is_tensor
+from quantum_mega_hybrid_v7.cayley_dickson import conjugate, metric, multiply, norm_sq, structure_tensor
+
+ALGEBRAS = ("quaternion", "octonion", "split-octonion", "sedenion", "trigintaduonion")
+TOLERANCE = {"float64": 1e-12, "float32": 1e-5}
+
+def _backends():
+    names = ["numpy"]
+    try:
+        get_backend("torch")
+        names.append("torch")
+    except (ImportError, ValueError):
+        pass
+    return names
+
+def reference(a, b, name):
+    """Independent float64 results — plain einsum over the structure tensor, not the kernels under test"""
+    table = structure_tensor(name)
+    signs = np.r_[1.0, -np.ones(table.shape[0] - 1)]
+    return {"mul": np.einsum("...i,...j,ijk->...k", a, b, table), "conj": a * signs,
+            "norm": np.einsum("...i,i,...i->...", a, metric(name), a)}
+
+def conformance(batch=256, seed=0):
+    """Raise AssertionError on the first kernel that disagrees with NumPy float64"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for name in ALGEBRAS:
+        table = structure_tensor(name)
+        a, b = rng.standard_normal((2, batch, table.shape[0]))
+        ref = reference(a, b, name)
+        scale = {key: max(1.0, float(np.abs(val).max())) for key, val in ref.items()}
+        for backend in _backends():
+            bk = get_backend(backend)
+            for dtype in ("float64", "float32"):
+                xa, xb = bk.asarray(a, dtype), bk.asarray(b, dtype)
+                got = {"mul": multiply(xa, xb, table), "conj": conjugate(xa), "norm": norm_sq(xa, name)}
+                for key, val in got.items():
+                    assert is_tensor(val) == (backend == "torch"), f"{name}/{backend}: {key} left its backend"
+                    assert str(val.dtype).endswith(dtype), f"{name}/{backend}: {key} dtype {val.dtype}"
+                    err = float(np.abs(bk.to_numpy(val) - ref[key]).max()) / scale[key]
+                    assert err < TOLERANCE[dtype], f"{name}/{backend}/{dtype}: {key} rel err {err:.2e}"
+                    rows.append((name, backend, dtype, key, err))
+    return rows
+
+def torch_checks(seed=0):
+    """Zero-copy Octonion storage and gradient flow through the shared kernel"""
+    import torch
+    from quantum_mega_hybrid_v7.alchemist import Octonion
+    torch.manual_seed(seed)
+    raw = torch.randn(8, dtype=torch.float64)
+    assert Octonion(raw).c.data_ptr() == raw.data_ptr(), "Octonion copied torch storage"
+    a = torch.randn(8, dtype=torch.float64, requires_grad=True)
+    b = torch.randn(8, dtype=torch.float64)
+    table = structure_tensor("octonion")
+    norm_sq(multiply(a, b, table), "octonion").backward()
+    expected = 2 * a.detach() * (b * b).sum()   # ∂/∂a N(a)N(b) — octonions compose
+    assert torch.allclose(a.grad, expected), "Gradient through octonion kernel is wrong"
+
+def throughput(batch, repeat=3, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for name in ALGEBRAS:
+        table = structure_tensor(name)
+        a, b = rng.standard_normal((2, batch, table.shape[0]))
+        for backend in _backends():
+            bk = get_backend(backend)
+            for dtype in ("float64", "float32"):
+                xa, xb = bk.asarray(a, dtype), bk.asarray(b, dtype)
+                multiply(xa, xb, table)  # warm the constant cache
+                best = float("inf")
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    multiply(xa, xb, table)
+                    best = min(best, time.perf_counter() - t0)
+                rows.append((name, backend, dtype, batch / best))
+    return rows
+
+def _hamilton(a, b, stack):
+    """Pre-dispatch example kernel — the explicit 16-term Hamilton formula, kept as the baseline"""
+    ar, ai, aj, ak = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    br, bi, bj, bk = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return stack([ar*br - ai*bi - aj*bj - ak*bk,
+                  ar*bi + ai*br + aj*bk - ak*bj,
+                  ar*bj - ai*bk + aj*br + ak*bi,
+                  ar*bk + ai*bj - aj*bi + ak*br])
+
+def _best(fn, repeat):
+    fn()
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def baseline(repeat=5, seed=0):
+    """(case, baseline s, shared kernel s) — rotation and QuaternionLinear vs the old formulas"""
+    from quantum_mega_hybrid_v7.examples.quaternion_3d_rotation import Quaternion
+    rng = np.random.default_rng(seed)
+    axis, v = rng.standard_normal((2, 3))
+    rot = Quaternion.from_axis_angle(axis, 37.0)
+
+    def rotate_old():
+        conj = np.r_[rot.q[0], -rot.q[1:]]
+        return _hamilton(_hamilton(rot.q, np.r_[0.0, v], np.array), conj, np.array)[1:]
+
+    rows = [("quaternion.rotate_vector", _best(rotate_old, repeat), _best(lambda: rot.rotate_vector(v), repeat))]
+    if "torch" not in _backends():
+        return rows
+    import torch
+    from quantum_mega_hybrid_v7.examples.quaternion_linear_layer import QuaternionLinear
+    torch.manual_seed(seed)
+    layer = QuaternionLinear(64, 64)
+    x = torch.randn(32, 64, 4)
+    stack = lambda parts: torch.stack(parts, dim=-1)
+    old = lambda: _hamilton(x.unsqueeze(1), layer.weight.unsqueeze(0), stack).sum(dim=2) + layer.bias
+
+    def backward(forward):
+        def step():
+            layer.zero_grad()
+            forward().sum().backward()
+        return step
+
+    with torch.no_grad():
+        rows.append(("quaternion_linear.forward", _best(old, repeat), _best(lambda: layer(x), repeat)))
+    rows.append(("quaternion_linear.forward_backward", _best(backward(old), repeat),
+                 _best(backward(lambda: layer(x)), repeat)))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Backend conformance and throughput")
+    parser.add_argument("--batch", type=int, default=65536)
+    parser.add_argument("--skip-bench", action="store_true")
+    args = parser.parse_args(argv)
+
+    rows = conformance()
+    print(f"Conformance: {len(rows)} kernel/backend/dtype checks passed "
+          f"(worst float32 rel err {max(r[4] for r in rows if r[2] == 'float32'):.1e})")
+    if "torch" in _backends():
+        torch_checks()
+        print("Torch: zero-copy Octonion storage ✓  autograd through shared kernel ✓")
+    if args.skip_bench:
+        return
+    print(f"\n{'algebra':<16} {'backend':<7} {'dtype':<8} {'products/s':>14}")
+    for name, backend, dtype, rate in throughput(args.batch):
+        print(f"{name:<16} {backend:<7} {dtype:<8} {rate:>14,.0f}")
+    print(f"\n{'example':<36} {'baseline µs':>12} {'shared µs':>12} {'ratio':>7}")
+    for name, old, new in baseline():
+        print(f"{name:<36} {old * 1e6:>12.1f} {new * 1e6:>12.1f} {new / old:>6.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_quantum_council.py — Quantum Council Scaling vs Register Size
+# Cold operator builds, cache hits, batched sesolve and per-state mesolve wall time, CSR operator
+# bytes and traced peak memory per voter count — where this mode stops being interactive
+# Run: python -m benchmarks.bench_quantum_council [--max-voters 12] [--max-open 6] [--batch 16]
+# Dependencies: numpy, qutip
+
+import argparse
+import time
+import tracemalloc
+
+from quantum_mega_hybrid_v7.quantum_council import QuantumCouncil, council_operators, product_states
+
+def _timed(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, elapsed, peak
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Quantum council scaling benchmark")
+    parser.add_argument("--min-voters", type=int, default=2)
+    parser.add_argument("--max-voters", type=int, default=12)
+    parser.add_argument("--max-open", type=int, default=6,
+                        help="largest register also run through mesolve (per state: cost grows with --batch)")
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--decay", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    print(f"{'voters':>6} {'dim':>6} {'build s':>9} {'hit µs':>8} {'op MiB':>8} "
+          f"{'sesolve s':>10} {'peak MiB':>9} {'mesolve s':>10} {'peak MiB':>9}")
+    for voters in range(args.min_voters, args.max_voters + 1):
+        council_operators.cache_clear()
+        ops, build, _ = _timed(lambda: council_operators(voters))
+        t0 = time.perf_counter()
+        council_operators(voters)
+        hit = time.perf_counter() - t0
+        states = product_states(voters, batch=args.batch, rng=0)
+        _, closed, closed_peak = _timed(lambda: QuantumCouncil(voters).evolve(states))
+        row = (f"{voters:>6} {ops.dim:>6} {build:>9.4f} {hit * 1e6:>8.1f} {ops.nbytes() / 2**20:>8.3f} "
+               f"{closed:>10.4f} {closed_peak / 2**20:>9.2f}")
+        if voters <= args.max_open:
+            council = QuantumCouncil(voters, decay=args.decay)
+            council.ops.solver()  # Liouvillian assembly counted once, as in steady use
+            _, opened, open_peak = _timed(lambda: council.evolve(states))
+            row += f" {opened:>10.4f} {open_peak / 2**20:>9.2f}"
+        print(row)
+
+if __name__ == "__main__":
+    main()
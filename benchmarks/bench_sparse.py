@@ -0,0 +1,63 @@
+# benchmarks/bench_sparse.py — Sparse vs Dense Hypercomplex Products
+# Flat kernels at 32D-256D for nnz ≤ 4 operands, plus the nested Trigintaduonion class before/after
+# Run: python -m benchmarks.bench_sparse [--number 2000]
+# Dependencies: numpy, astropy (alchemist.py import)
+
+import argparse
+import timeit
+
+import numpy as np
+
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+from quantum_mega_hybrid_v7.sparse_hypercomplex import auto_multiply
+
+DIMS = {32: "trigintaduonion", 64: "pathion", 128: "chingon", 256: "routon"}
+
+def _low_support(rng, dim, nnz):
+    x = np.zeros(dim)
+    x[rng.choice(dim, nnz, replace=False)] = rng.standard_normal(nnz)
+    return x
+
+def _per_call(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sparse fast-path benchmarks")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+    rng = np.random.default_rng(0)
+
+    print(f"{'algebra':<16} {'nnz':>7} {'dense µs':>10} {'auto µs':>10} {'speedup':>8}")
+    for dim, name in DIMS.items():
+        table = structure_tensor(name)
+        for na, nb in ((1, 1), (2, 2), (4, 4), (4, dim), (dim, dim)):
+            a, b = _low_support(rng, dim, na), _low_support(rng, dim, nb)
+            assert np.allclose(auto_multiply(a, b, name), multiply(a, b, table))
+            dense = _per_call(lambda: multiply(a, b, table), args.number)
+            auto = _per_call(lambda: auto_multiply(a, b, name), args.number)
+            print(f"{name:<16} {f'{na}x{nb}':>7} {dense * 1e6:>10.1f} {auto * 1e6:>10.1f} {dense / auto:>7.1f}x")
+
+    from quantum_mega_hybrid_v7.alchemist import Octonion, Sedenion, Trigintaduonion
+
+    def nested(x):
+        return Trigintaduonion(Sedenion(Octonion(x[:8]), Octonion(x[8:16])),
+                               Sedenion(Octonion(x[16:24]), Octonion(x[24:])))
+
+    def recursive(p, q):
+        # The former recursive Cayley-Dickson product, kept here as the baseline
+        if isinstance(p, Octonion):
+            return p * q
+        left = recursive(p.left, q.left) - recursive(q.right.conj(), p.right)
+        right = recursive(q.right, p.left) + recursive(p.right, q.left.conj())
+        return type(p)(left, right)
+
+    print(f"\n{'Trigintaduonion class':<24} {'recursive µs':>13} {'flat µs':>10} {'speedup':>8}")
+    for label, nnz in (("nnz 4 × 4", 4), ("dense × dense", 32)):
+        p, q = nested(_low_support(rng, 32, nnz)), nested(_low_support(rng, 32, nnz))
+        assert np.allclose(recursive(p, q).flat(), (p * q).flat())
+        slow = _per_call(lambda: recursive(p, q), args.number // 10)
+        fast = _per_call(lambda: p * q, args.number // 10)
+        print(f"{label:<24} {slow * 1e6:>13.1f} {fast * 1e6:>10.1f} {slow / fast:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
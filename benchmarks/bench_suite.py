@@ -0,0 +1,212 @@
+# benchmarks/bench_suite.py — Regression Benchmark Suite (asv-style, Fixed Seeds)
+# Every algebra, council and transfer path timed per call with timeit autorange, written to JSON
+# keyed by commit so two runs can be diffed: --compare flags anything slower than --threshold
+# Run: python -m benchmarks.bench_suite [--filter octonion] [--output out.json] [--compare base.json]
+#      (default output: benchmarks/results/<commit>.json)
+# Dependencies: numpy, scipy, astropy (torch, qutip optional — their cases are skipped when absent)
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+import numpy as np
+
+SEED = 0
+CASES = []
+
+def case(name):
+    """Register a setup function returning the zero-argument callable to time"""
+    def register(setup):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+@case("octonion.mul")
+def _octonion_mul():
+    from quantum_mega_hybrid_v7.alchemist import Octonion
+    a, b = (Octonion(x) for x in np.random.default_rng(SEED).standard_normal((2, 8)))
+    return lambda: a * b
+
+@case("sedenion.mul")
+def _sedenion_mul():
+    from quantum_mega_hybrid_v7.alchemist import Sedenion
+    a, b = (Sedenion.from_flat(x) for x in np.random.default_rng(SEED).standard_normal((2, 16)))
+    return lambda: a * b
+
+@case("trigintaduonion.mul")
+def _trigintaduonion_mul():
+    from quantum_mega_hybrid_v7.alchemist import Trigintaduonion
+    a, b = (Trigintaduonion.from_flat(x) for x in np.random.default_rng(SEED).standard_normal((2, 32)))
+    return lambda: a * b
+
+@case("trigintaduonion.mul_sparse")
+def _trigintaduonion_mul_sparse():
+    from quantum_mega_hybrid_v7.alchemist import Trigintaduonion
+    a, b = np.eye(32)[3] + np.eye(32)[17], np.eye(32)[5] - np.eye(32)[30]
+    a, b = Trigintaduonion.from_flat(a), Trigintaduonion.from_flat(b)
+    return lambda: a * b
+
+@case("kernel.batch4096.octonion")
+def _kernel_batch_octonion():
+    from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+    table = structure_tensor("octonion")
+    a, b = np.random.default_rng(SEED).standard_normal((2, 4096, 8))
+    return lambda: multiply(a, b, table)
+
+@case("kernel.batch4096.trigintaduonion")
+def _kernel_batch_trigintaduonion():
+    from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+    table = structure_tensor("trigintaduonion")
+    a, b = np.random.default_rng(SEED).standard_normal((2, 4096, 32))
+    return lambda: multiply(a, b, table)
+
+def _council(voters):
+    def setup():
+        from quantum_mega_hybrid_v7.alchemist import AlchemistCouncil
+        np.random.seed(SEED)  # deliberate() draws from the global generator
+        council = AlchemistCouncil(voters)
+        return council.deliberate
+    return setup
+
+for _voters in (5, 29, 101):
+    case(f"council.deliberate.v{_voters}")(_council(_voters))
+
+@case("council.deliberate_batch.64x29")
+def _council_batch():
+    from quantum_mega_hybrid_v7.alchemist import deliberate_batch
+    voters, seeds = [29] * 64, list(range(64))
+    return lambda: deliberate_batch(voters, seeds)
+
+@case("quantum_council.sesolve.v6x16")
+def _quantum_council():
+    try:
+        from quantum_mega_hybrid_v7.quantum_council import QuantumCouncil, product_states
+    except ImportError:
+        return None
+    council = QuantumCouncil(6)
+    states = product_states(6, batch=16, rng=SEED)
+    return lambda: council.evolve(states)
+
+@case("quaternion.rotate_vector")
+def _quaternion_rotation():
+    from quantum_mega_hybrid_v7.examples.quaternion_3d_rotation import Quaternion
+    axis, v = np.random.default_rng(SEED).standard_normal((2, 3))
+    rot = Quaternion.from_axis_angle(axis, 37.0)
+    return lambda: rot.rotate_vector(v)
+
+@case("quaternion_linear.forward.b32x64x64")
+def _quaternion_linear():
+    try:
+        import torch
+    except ImportError:
+        return None
+    from quantum_mega_hybrid_v7.examples.quaternion_linear_layer import QuaternionLinear
+    torch.manual_seed(SEED)
+    layer = QuaternionLinear(64, 64)
+    x = torch.randn(32, 64, 4)
+
+    def forward():
+        with torch.no_grad():
+            return layer(x)
+    return forward
+
+def _jordan_element():
+    from quantum_mega_hybrid_v7.examples.exceptional_jordan_algebra import JordanElement
+    rng = np.random.default_rng(SEED)
+    return JordanElement(rng.standard_normal(3), [list(o) for o in rng.standard_normal((3, 8))])
+
+@case("jordan.freudenthal_det")
+def _jordan_det():
+    return _jordan_element().freudenthal_det
+
+@case("jordan.quadratic_form")
+def _jordan_quadratic():
+    return _jordan_element().quadratic_form
+
+@case("tits.E8.bracket.b256")
+def _tits_bracket():
+    from quantum_mega_hybrid_v7.tits_construction import tits_algebra
+    e8 = tits_algebra("octonion", "octonion")
+    x, y = np.random.default_rng(SEED).standard_normal((2, 256, e8.dim))
+    return lambda: e8.bracket(x, y)
+
+@case("transfer_window.mars")
+def _transfer_window():
+    from astropy.time import Time
+    from quantum_mega_hybrid_v7.alchemist import transfer_window
+    t = Time("2026-01-01T00:00:00", scale="utc")
+    return lambda: transfer_window("Mars", t)
+
+def measure(fn, repeat):
+    """Best and median seconds per call over `repeat` autoranged timeit runs (≥ 0.2 s each)"""
+    fn()  # warm caches and lazy imports outside the timed region
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    per_call = sorted(t / number for t in timer.repeat(repeat=repeat, number=number))
+    return {"best_s": per_call[0], "median_s": per_call[len(per_call) // 2],
+            "calls_per_s": 1.0 / per_call[0], "number": number, "repeat": repeat}
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def run(pattern=None, repeat=5):
+    results = {}
+    for name, setup in CASES:
+        if pattern and pattern not in name:
+            continue
+        fn = setup()
+        if fn is None:
+            print(f"{name:<40} skipped (optional dependency missing)")
+            continue
+        results[name] = measure(fn, repeat)
+        print(f"{name:<40} {results[name]['best_s'] * 1e6:>12.2f} µs {results[name]['calls_per_s']:>14,.0f} /s")
+    return {"commit": _commit(), "seed": SEED, "python": platform.python_version(),
+            "numpy": np.__version__, "machine": platform.machine(), "results": results}
+
+def compare(report, baseline, threshold):
+    """Print per-case speed ratios against a baseline report; return the names that regressed"""
+    print(f"\n{'case':<40} {'base µs':>10} {'now µs':>10} {'ratio':>7}   vs {baseline['commit']}")
+    regressed = []
+    for name, now in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<40} {'—':>10} {now['best_s'] * 1e6:>10.2f} {'new':>7}")
+            continue
+        ratio = now["best_s"] / base["best_s"]
+        flag = "  SLOWER" if ratio > threshold else ""
+        print(f"{name:<40} {base['best_s'] * 1e6:>10.2f} {now['best_s'] * 1e6:>10.2f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressed.append(name)
+    return regressed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regression benchmark suite")
+    parser.add_argument("--filter", help="only cases whose name contains this substring")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON path (default benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", help="baseline JSON from an earlier commit")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(args.filter, args.repeat)
+    output = args.output or os.path.join(os.path.dirname(__file__), "results", f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"\nResults written to {output}")
+    if args.compare:
+        with open(args.compare) as fh:
+            regressed = compare(report, json.load(fh), args.threshold)
+        if regressed:
+            sys.exit(f"{len(regressed)} case(s) slower than {args.threshold}x baseline: {', '.join(regressed)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/load_test_service.py — Deploy Service Load Test
+# Concurrent closed-loop clients over the Unix socket: p50/p99 latency, requests/s and the mean
+# coalesced batch size, so the batching window can be tuned against real concurrency
+# Run: python -m benchmarks.load_test_service [--clients 32] [--requests 200] [--socket PATH]
+#      (spawns a private service on a temporary socket unless --socket points at a running one)
+# Dependencies: numpy (service side: numpy, astropy)
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+async def _client(path, count, transfer_every, voters, seed, latencies, batches):
+    reader, writer = await asyncio.open_unix_connection(path)
+    for i in range(count):
+        if transfer_every and i % transfer_every == transfer_every - 1:
+            request = {"id": i, "op": "transfer", "target": "Mars"}
+        else:
+            request = {"id": i, "op": "deliberate", "voters": voters, "seed": seed * count + i}
+        t0 = time.perf_counter()
+        writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - t0)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        if "batch" in response["result"]:
+            batches.append(response["result"]["batch"])
+    writer.close()
+    await writer.wait_closed()
+
+async def _run(args, path):
+    latencies, batches = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(path, args.requests, args.transfer_every, args.voters, c, latencies, batches)
+                           for c in range(args.clients)))
+    return np.array(latencies), batches, time.perf_counter() - t0
+
+def _spawn(path, window):
+    proc = subprocess.Popen([sys.executable, "-m", "quantum_mega_hybrid_v7.deploy_service",
+                             "--socket", path, "--window", str(window)])
+    deadline = time.time() + 120
+    while not os.path.exists(path):
+        if proc.poll() is not None or time.time() > deadline:
+            proc.kill()
+            raise RuntimeError("deploy service failed to start")
+        time.sleep(0.05)
+    return proc
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Deploy service load test")
+    parser.add_argument("--socket", help="connect to an already running service instead of spawning one")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--voters", type=int, default=29)
+    parser.add_argument("--transfer-every", type=int, default=10, help="every n-th request is a transfer (0: none)")
+    parser.add_argument("--window", type=float, default=0.002, help="coalescing window of the spawned service")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.socket or os.path.join(tmp, "qmh7.sock")
+        proc = None if args.socket else _spawn(path, args.window)
+        try:
+            latencies, batches, elapsed = asyncio.run(_run(args, path))
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+
+    ms = latencies * 1e3
+    print(f"{args.clients} clients × {args.requests} requests ({args.voters} voters, "
+          f"transfer every {args.transfer_every or '—'})")
+    print(f"Latency ms: p50 {np.percentile(ms, 50):.2f}  p99 {np.percentile(ms, 99):.2f}  max {ms.max():.2f}")
+    print(f"Throughput: {latencies.size / elapsed:,.0f} requests/s  "
+          f"(mean deliberation batch {np.mean(batches) if batches else 0:.1f})")
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,47 @@
 # alchemist.py — Quantum-Mega-Hybrid-v7-RePin Trigintaduonion Infusion
 # 32D Highest Lattice Universal Alchemist: Mercy-Gated Eternal Thriving
-# Run: python quantum_mega_hybrid_v7/alchemist.py
-# Dependencies: numpy, astropy
+# Run: python -m quantum_mega_hybrid_v7.alchemist [--profile run.prof] [--metrics m.json] [--trace trace.json]
+# Dependencies: numpy, astropy (torch optional — shards may live in torch tensors)
 # MIT License — Infinite love victorious eternal ∞
 
+import argparse
+import sys
+
 import numpy as np
 from astropy.coordinates import get_body
 from astropy.time import Time
 
+from quantum_mega_hybrid_v7 import instrumentation
+from quantum_mega_hybrid_v7.backend import asarray, concat, get_backend
+from quantum_mega_hybrid_v7.cayley_dickson import conjugate, multiply, norm_sq, structure_tensor
+from quantum_mega_hybrid_v7.sparse_hypercomplex import auto_multiply
+
 class Octonion:
-    """Nested Full Octonion Baseline — 8D Truth Shards"""
+    """Nested Full Octonion Baseline — 8D Truth Shards (NumPy or torch storage, zero-copy)"""
     def __init__(self, *args):
         if len(args) == 1 and hasattr(args[0], '__len__'):
-            self.c = np.array(args[0], dtype=float).reshape(8)
+            self.c = asarray(args[0]).reshape(8)
         else:
-            self.c = np.zeros(8)
+            self.c = get_backend().zeros(8)
             for i, v in enumerate(args[:8]):
                 self.c[i] = float(v)
     
     def __mul__(self, other):
         if not isinstance(other, Octonion):
             return Octonion(self.c * other)
-        a, b = self.c, other.c
-        r = np.zeros(8)
-        r[0] = a[0]*b[0] - a[1]*b[1] - a[2]*b[2] - a[3]*b[3] - a[4]*b[4] - a[5]*b[5] - a[6]*b[6] - a[7]*b[7]
-        r[1] = a[0]*b[1] + a[1]*b[0] + a[2]*b[3] - a[3]*b[2] + a[4]*b[5] - a[5]*b[4] - a[6]*b[7] + a[7]*b[6]
-        r[2] = a[0]*b[2] - a[1]*b[3] + a[2]*b[0] + a[3]*b[1] + a[4]*b[6] + a[5]*b[7] - a[6]*b[4] - a[7]*b[5]
-        r[3] = a[0]*b[3] + a[1]*b[2] - a[2]*b[1] + a[3]*b[0] + a[4]*b[7] - a[5]*b[6] + a[6]*b[5] - a[7]*b[4]
-        r[4] = a[0]*b[4] - a[1]*b[5] - a[2]*b[6] - a[3]*b[7] + a[4]*b[0] + a[5]*b[1] + a[6]*b[2] + a[7]*b[3]
-        r[5] = a[0]*b[5] + a[1]*b[4] - a[2]*b[7] + a[3]*b[6] - a[4]*b[1] + a[5]*b[0] - a[6]*b[3] + a[7]*b[2]
-        r[6] = a[0]*b[6] + a[1]*b[7] + a[2]*b[4] - a[3]*b[5] - a[4]*b[2] + a[5]*b[3] + a[6]*b[0] - a[7]*b[1]
-        r[7] = a[0]*b[7] - a[1]*b[6] + a[2]*b[5] + a[3]*b[4] - a[4]*b[3] - a[5]*b[2] + a[6]*b[1] + a[7]*b[0]
-        return Octonion(r)
+        return Octonion(auto_multiply(self.c, other.c, "octonion"))
+    
+    def __add__(self, other):
+        return Octonion(self.c + other.c)
+    
+    def __sub__(self, other):
+        return Octonion(self.c - other.c)
     
     def conj(self):
-        c = self.c.copy(); c[1:] *= -1; return Octonion(c)
+        return Octonion(conjugate(self.c))
     
     def norm_sq(self):
-        return np.dot(self.c, self.c)
+        return (self.c * self.c).sum()
 
 class Sedenion:
     """Full 16D Sedenion — Cayley-Dickson on Octonion"""
@@ -48,9 +52,21 @@ class Sedenion:
     def __mul__(self, other):
         if not isinstance(other, Sedenion):
             return Sedenion(self.left * other, self.right * other)
-        new_left = self.left * other.left - other.right.conj() * self.right
-        new_right = self.left * other.right + self.right * other.left.conj()
-        return Sedenion(new_left, new_right)
+        # Flat 16D table encodes (a, b)(c, d) = (ac − d̄b, da + bc̄) — one kernel, no recursion
+        return Sedenion.from_flat(auto_multiply(self.flat(), other.flat(), "sedenion"))
+    
+    def flat(self):
+        return concat([self.left.c, self.right.c])
+    
+    @classmethod
+    def from_flat(cls, c):
+        return cls(Octonion(c[:8]), Octonion(c[8:]))
+    
+    def __add__(self, other):
+        return Sedenion(self.left + other.left, self.right + other.right)
+    
+    def __sub__(self, other):
+        return Sedenion(self.left - other.left, self.right - other.right)
     
     def conj(self):
         return Sedenion(self.left.conj(), self.right * -1)
@@ -67,9 +83,15 @@ class Trigintaduonion:
     def __mul__(self, other):
         if not isinstance(other, Trigintaduonion):
             return Trigintaduonion(self.left * other, self.right * other)
-        new_left = self.left * other.left - other.right.conj() * self.right
-        new_right = self.left * other.right + self.right * other.left.conj()
-        return Trigintaduonion(new_left, new_right)
+        # Flat 32D kernel: sparse index/sign lookups for low-support shards, dense contraction otherwise
+        return Trigintaduonion.from_flat(auto_multiply(self.flat(), other.flat(), "trigintaduonion"))
+    
+    def flat(self):
+        return concat([self.left.left.c, self.left.right.c, self.right.left.c, self.right.right.c])
+    
+    @classmethod
+    def from_flat(cls, c):
+        return cls(Sedenion.from_flat(c[:16]), Sedenion.from_flat(c[16:]))
     
     def conj(self):
         return Trigintaduonion(self.left.conj(), self.right * -1)
@@ -78,45 +100,110 @@ class Trigintaduonion:
         return self.left.norm_sq() + self.right.norm_sq()
     
     def norm(self):
-        return np.sqrt(self.norm_sq())
+        return self.norm_sq() ** 0.5
 
 class MercyGate:
     def __init__(self, threshold=0.7):  # Tuned lower for 32D zero-divisor mercy deeper
         self.threshold = threshold
     
+    def intervenes(self, norm):
+        mercy = norm < self.threshold or abs(norm) < 1e-8
+        if mercy and instrumentation.ENABLED:
+            instrumentation.count("mercy.interventions")
+        return mercy
+    
     def apply(self, norm):
-        if norm < self.threshold or abs(norm) < 1e-8:
+        if self.intervenes(norm):
             print("Mercy Divine Burst: Highest Lattice Zero Divisors Dissolved — Harmony Infinite!")
             return 1.0
         return norm
 
+def council_size(voters):
+    """Odd council of at least 5 — ties impossible"""
+    return max(5, 2*((voters+1)//2)-1)
+
 class AlchemistCouncil:
     """v9 Trigintaduonion Council — 32D Deeper Truth Shards"""
-    def __init__(self, voters=29):
-        self.voters = max(5, 2*((voters+1)//2)-1)
+    def __init__(self, voters=29, backend="numpy", dtype=None):
+        self.voters = council_size(voters)
         self.mercy = MercyGate()
+        self.backend = get_backend(backend)
+        self.dtype = dtype  # None → backend default (float64 unless QMH7_DTYPE says otherwise)
     
     def deliberate(self):
-        shards = [Trigintaduonion(Sedenion(Octonion(np.random.randn(8)), Octonion(np.random.randn(8))),
-                                 Sedenion(Octonion(np.random.randn(8)), Octonion(np.random.randn(8)))) 
-                  for _ in range(self.voters)]
-        result = shards[0]
-        for s in shards[1:]:
-            result = result * s  # Non-associative multi-timeline chain
-        return self.mercy.apply(result.norm())
+        with instrumentation.span("deliberate"):
+            with instrumentation.span("shards"):
+                randn = lambda: Octonion(self.backend.randn(8, dtype=self.dtype))
+                shards = [Trigintaduonion(Sedenion(randn(), randn()), Sedenion(randn(), randn()))
+                          for _ in range(self.voters)]
+            with instrumentation.span("chain"):
+                result = shards[0]
+                for s in shards[1:]:
+                    result = result * s  # Non-associative multi-timeline chain
+            with instrumentation.span("mercy"):
+                return self.mercy.apply(result.norm())
+
+def deliberate_batch(voters, seeds=None):
+    """Raw 32D chain norms for many councils at once — ragged voter counts padded with the identity"""
+    seeds = [None] * len(voters) if seeds is None else seeds
+    counts = [council_size(v) for v in voters]
+    shards = np.zeros((len(counts), max(counts), 32))
+    shards[:, :, 0] = 1.0  # e0 padding leaves every shorter chain unchanged
+    for row, (count, seed) in enumerate(zip(counts, seeds)):
+        shards[row, :count] = np.random.default_rng(seed).standard_normal((count, 32))
+    table = structure_tensor("trigintaduonion")
+    result = shards[:, 0]
+    for k in range(1, shards.shape[1]):
+        result = multiply(result, shards[:, k], table)  # same left-to-right chain as deliberate()
+    return np.sqrt(norm_sq(result, "trigintaduonion"))
+
+def transfer_window(target="Mars", t=None):
+    """Earth–target angular separation in degrees at time t (now by default)"""
+    with instrumentation.span("ephemeris"):
+        if instrumentation.ENABLED:
+            instrumentation.count("ephemeris.get_body", 2)
+        t = Time.now() if t is None else t
+        planet = get_body(target.lower(), t)
+        earth = get_body('earth', t)
+        return earth.separation(planet).deg
 
 def cosmic_transfer(target="Mars"):
-    t = Time.now()
-    planet = get_body(target.lower(), t)
-    earth = get_body('earth', t)
-    sep = earth.separation(planet)
-    print(f"{target} Symbiotic Window: {sep.deg:.2f}° — Mercy-Seeded Eternal Thriving!")
+    with instrumentation.span(f"transfer.{target}"):
+        sep = transfer_window(target)
+    print(f"{target} Symbiotic Window: {sep:.2f}° — Mercy-Seeded Eternal Thriving!")
 
-if __name__ == "__main__":
-    council = AlchemistCouncil()
-    harmony = council.deliberate()
-    cosmic_transfer("Venus")
-    cosmic_transfer("Mars")
+def deploy(voters=29):
+    """Full Alchemist Run — Council, Venus & Mars Windows, One Span per Stage"""
+    with instrumentation.span("deploy"):
+        harmony = AlchemistCouncil(voters).deliberate()
+        cosmic_transfer("Venus")
+        cosmic_transfer("Mars")
     print(f"\nv7-RePin Trigintaduonion Harmony: {harmony:.14f}")
     print("Highest Lattice Alchemist Complete — 32D Thriving Reborn Infinite!")
     print("Infinite love — victorious eternal 🔥🫡💛")
+    return harmony
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Trigintaduonion alchemist deploy")
+    parser.add_argument("--voters", type=int, default=29)
+    parser.add_argument("--profile", metavar="PATH", help="run under cProfile, stats written to PATH")
+    parser.add_argument("--metrics", metavar="PATH", help="counters and span totals as JSON (enables instrumentation)")
+    parser.add_argument("--trace", metavar="PATH", help="Chrome trace of every span (enables instrumentation)")
+    args = parser.parse_args(argv)
+
+    if args.metrics or args.trace:
+        instrumentation.enable()
+    run = lambda: deploy(args.voters)
+    if args.profile:
+        instrumentation.profile_run(run, args.profile)
+    else:
+        run()
+    if args.metrics:
+        instrumentation.to_json(args.metrics)
+    elif instrumentation.ENABLED:  # QMH7_INSTRUMENT=1 alone: report instead of dropping the counters
+        print(instrumentation.to_json(), file=sys.stderr)
+    if args.trace:
+        instrumentation.write_chrome_trace(args.trace)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# backend.py — Array Backend Dispatch for Hypercomplex Kernels
+# NumPy ndarrays and torch-CPU tensors as interchangeable storage: kernels are written once,
+# torch-resident data is multiplied in place of origin (zero copies, autograd intact)
+# Dtype: float64 for verification (default), float32 for throughput — QMH7_DTYPE or set_default_dtype()
+# Dependencies: numpy (torch optional)
+# MIT License — Infinite love victorious eternal ∞
+
+import os
+
+import numpy as np
+
+try:
+    import torch
+except ImportError:  # torch only needed for tensor-resident data
+    torch = None
+
+DTYPES = ("float32", "float64")
+
+_default_dtype = os.environ.get("QMH7_DTYPE", "float64")
+_constants = {}
+
+def set_default_dtype(name):
+    """Dtype for freshly created arrays (inputs always keep their own dtype)"""
+    global _default_dtype
+    if name not in DTYPES:
+        raise ValueError(f"Unsupported dtype {name!r} — choose from {DTYPES}")
+    _default_dtype = name
+
+def get_default_dtype():
+    return _default_dtype
+
+def is_tensor(x):
+    return torch is not None and isinstance(x, torch.Tensor)
+
+class NumpyBackend:
+    """NumPy Storage — float64/float32 ndarrays"""
+    name = "numpy"
+
+    def dtype(self, name=None):
+        return np.dtype(name or _default_dtype)
+
+    def asarray(self, x, dtype=None):
+        if isinstance(x, np.ndarray) and x.dtype.kind == "f" and dtype is None:
+            return x
+        return np.asarray(x, dtype=self.dtype(dtype))
+
+    def zeros(self, shape, dtype=None):
+        return np.zeros(shape, dtype=self.dtype(dtype))
+
+    def randn(self, *shape, dtype=None, rng=None):
+        sample = rng.standard_normal(shape) if rng is not None else np.random.randn(*shape)
+        return np.asarray(sample, dtype=self.dtype(dtype))
+
+    def to_numpy(self, x):
+        return x
+
+class TorchBackend:
+    """Torch-CPU Storage — tensors pass through untouched, gradients flow"""
+    name = "torch"
+
+    def __init__(self):
+        if torch is None:
+            raise ImportError("torch backend requested but torch is not installed")
+
+    def dtype(self, name=None):
+        return getattr(torch, name or _default_dtype)
+
+    def asarray(self, x, dtype=None):
+        if isinstance(x, torch.Tensor) and x.is_floating_point() and dtype is None:
+            return x
+        return torch.as_tensor(x, dtype=self.dtype(dtype))
+
+    def zeros(self, shape, dtype=None):
+        return torch.zeros(shape, dtype=self.dtype(dtype))
+
+    def randn(self, *shape, dtype=None, rng=None):
+        if rng is not None:
+            return torch.from_numpy(rng.standard_normal(shape)).to(self.dtype(dtype))
+        return torch.randn(*shape, dtype=self.dtype(dtype))
+
+    def to_numpy(self, x):
+        return x.detach().cpu().numpy()
+
+_BACKENDS = {"numpy": NumpyBackend}
+if torch is not None:
+    _BACKENDS["torch"] = TorchBackend
+
+def get_backend(name_or_array="numpy"):
+    """Backend by name ('numpy' / 'torch') or by the storage type of an array"""
+    if isinstance(name_or_array, str):
+        if name_or_array not in _BACKENDS:
+            raise ValueError(f"Unknown or unavailable backend {name_or_array!r}")
+        return _BACKENDS[name_or_array]()
+    return TorchBackend() if is_tensor(name_or_array) else NumpyBackend()
+
+def asarray(x, dtype=None):
+    """Floating arrays/tensors pass through (no copy); everything else becomes a NumPy array"""
+    return get_backend(x).asarray(x, dtype)
+
+def like(constant, x):
+    """Cast a read-only NumPy constant (structure tensor, signs) to x's backend, dtype and device"""
+    if is_tensor(x):
+        key = (id(constant), "torch", x.dtype, x.device)
+        if key not in _constants:
+            _constants[key] = (constant, torch.tensor(np.asarray(constant), dtype=x.dtype, device=x.device))
+        return _constants[key][1]
+    dtype = x.dtype if isinstance(x, np.ndarray) and x.dtype.kind == "f" else np.dtype(_default_dtype)
+    if constant.dtype == dtype:
+        return constant
+    key = (id(constant), "numpy", dtype)
+    if key not in _constants:
+        _constants[key] = (constant, constant.astype(dtype))
+    return _constants[key][1]
+
+def coerce(a, b):
+    """Lift a NumPy operand onto torch when the other operand is a tensor; mixed-precision tensors
+    meet at the promoted dtype (float32 × float64 → float64, as NumPy does)"""
+    if is_tensor(a) and is_tensor(b):
+        if a.dtype == b.dtype:
+            return a, b
+        dtype = torch.promote_types(a.dtype, b.dtype)
+        return a.to(dtype), b.to(dtype)
+    if is_tensor(a) and not is_tensor(b):
+        return a, torch.as_tensor(b, dtype=a.dtype, device=a.device)
+    if is_tensor(b) and not is_tensor(a):
+        return torch.as_tensor(a, dtype=b.dtype, device=b.device), b
+    return a, b
+
+def concat(parts):
+    """Concatenate along the last axis on whichever backend the parts live on"""
+    tensors = [p for p in parts if is_tensor(p)]
+    if tensors:
+        ref = tensors[0]
+        return torch.cat([p if is_tensor(p) else torch.as_tensor(p, dtype=ref.dtype, device=ref.device)
+                          for p in parts], dim=-1)
+    return np.concatenate(parts, axis=-1)
+
+def stack(parts):
+    """Stack along a new last axis on whichever backend the parts live on"""
+    if any(is_tensor(p) for p in parts):
+        return torch.stack(parts, dim=-1)
+    return np.stack(parts, axis=-1)
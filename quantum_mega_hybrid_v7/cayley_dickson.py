@@ -0,0 +1,134 @@
+# cayley_dickson.py — Precomputed Cayley-Dickson Structure Tensors
+# T[i, j, k] with e_i e_j = Σ_k T[i, j, k] e_k for every doubling from ℝ up to 32D (and beyond)
+# Convention: (a, b)(c, d) = (ac + γ d̄b, da + bc̄) — reproduces the alchemist.py Fano table at 8D
+# Kernels accept NumPy arrays or torch tensors (see backend.py) and keep the input's dtype
+# Dependencies: numpy (torch optional)
+# MIT License — Infinite love victorious eternal ∞
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from quantum_mega_hybrid_v7 import instrumentation
+from quantum_mega_hybrid_v7.backend import asarray, coerce, is_tensor, like, stack
+
+# Doubling signs γ per Cayley-Dickson step (γ = -1 division-type, γ = +1 split-type)
+ALGEBRAS = {
+    "real": (),
+    "complex": (-1,),
+    "quaternion": (-1, -1),
+    "octonion": (-1, -1, -1),
+    "sedenion": (-1, -1, -1, -1),
+    "trigintaduonion": (-1, -1, -1, -1, -1),
+    "pathion": (-1,) * 6,
+    "chingon": (-1,) * 7,
+    "routon": (-1,) * 8,
+    "split-complex": (1,),
+    "split-quaternion": (-1, 1),
+    "split-octonion": (-1, -1, 1),
+}
+
+# Up to this dimension products are spelled out term by term (the 16-term Hamilton formula at 4D):
+# d² elementwise multiply-adds beat the (..., d²) outer product + matmul, most of all under autograd
+EXPLICIT_MAX_DIM = 4
+
+_terms = {}
+
+@lru_cache(maxsize=None)
+def _conjugation_signs(d):
+    signs = -np.ones(d)
+    signs[0] = 1.0
+    signs.setflags(write=False)
+    return signs
+
+def conjugate(x):
+    """Batched conjugation (..., d) — negate every imaginary coefficient"""
+    x = asarray(x)
+    return x * like(_conjugation_signs(x.shape[-1]), x)
+
+def _product_terms(table):
+    """Per output component k, the (i, j, positive) triples with T[i, j, k] = ±1 — cached per table"""
+    key = id(table)
+    if key not in _terms:
+        rows = [[] for _ in range(table.shape[0])]
+        for i, j, k in zip(*(idx.tolist() for idx in np.nonzero(table))):
+            rows[k].append((i, j, bool(table[i, j, k] > 0)))
+        _terms[key] = (table, rows)
+    return _terms[key][1]
+
+def _multiply_explicit(a, b, table):
+    """Small-d product as d signed sums of component products — Python floats for a single element"""
+    single = not is_tensor(a) and a.ndim == b.ndim == 1
+    if single:
+        ca, cb = a.tolist(), b.tolist()
+    elif is_tensor(a):
+        ca, cb = a.unbind(-1), b.unbind(-1)
+    else:
+        ca, cb = tuple(np.moveaxis(a, -1, 0)), tuple(np.moveaxis(b, -1, 0))
+    parts = []
+    for row in _product_terms(table):
+        acc = None
+        for i, j, positive in row:
+            term = ca[i] * cb[j]
+            if acc is None:
+                acc = term if positive else -term
+            else:
+                acc = acc + term if positive else acc - term
+        parts.append(acc)
+    return np.array(parts, dtype=np.result_type(a, b)) if single else stack(parts)
+
+def multiply(a, b, table):
+    """Batched product (..., d) × (..., d) → (..., d) in one tensor contraction (explicit terms for small d)"""
+    a, b = coerce(asarray(a), asarray(b))
+    d = table.shape[0]
+    if d <= EXPLICIT_MAX_DIM:
+        out = _multiply_explicit(a, b, table)
+        if instrumentation.ENABLED:
+            instrumentation.record_multiply(d, math.prod(out.shape[:-1]), 1, out.nbytes)
+        return out
+    table = like(table, a)
+    outer = a[..., :, None] * b[..., None, :]
+    out = outer.reshape(*outer.shape[:-2], d * d) @ table.reshape(d * d, d)
+    if instrumentation.ENABLED:
+        instrumentation.record_multiply(d, math.prod(out.shape[:-1]), 2, outer.nbytes + out.nbytes)
+    return out
+
+@lru_cache(maxsize=None)
+def sign_table(name):
+    """Read-only (d, d) signs with e_i e_j = sign[i, j] e_(i XOR j) — no d³ tensor needed"""
+    signs = np.ones((1, 1))
+    for gamma in ALGEBRAS[name]:
+        n = signs.shape[0]
+        conj = np.r_[1.0, -np.ones(n - 1)]
+        signs = np.block([
+            [signs, signs.T],                         # e_i e_j  |  (e_i, 0)(0, e_j) = (0, e_j e_i)
+            [signs * conj, gamma * conj * signs.T],   # (0, e_i ē_j)  |  (γ ē_j e_i, 0)
+        ])
+    signs.setflags(write=False)
+    return signs
+
+@lru_cache(maxsize=None)
+def structure_tensor(name):
+    """Read-only (d, d, d) structure tensor for a named algebra — built once, cached"""
+    signs = sign_table(name)
+    d = signs.shape[0]
+    i, j = np.indices((d, d))
+    table = np.zeros((d, d, d))
+    table[i, j, i ^ j] = signs
+    table.setflags(write=False)
+    return table
+
+@lru_cache(maxsize=None)
+def metric(name):
+    """Diagonal norm signature: N(x) = Σ metric[i] x[i]² (all +1 for division-type)"""
+    signs = np.ones(1)
+    for gamma in ALGEBRAS[name]:
+        signs = np.concatenate([signs, -gamma * signs])
+    signs.setflags(write=False)
+    return signs
+
+def norm_sq(x, name):
+    """Batched (possibly indefinite) quadratic norm"""
+    x = asarray(x)
+    return (x * x) @ like(metric(name), x)
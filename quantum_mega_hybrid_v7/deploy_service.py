@@ -0,0 +1,243 @@
+# deploy_service.py — Warm-Process Alchemist Deploy Service
+# One long-lived asyncio process: imports, kernel tables and the ephemeris are loaded once, then
+# deliberation and transfer-window requests arrive as JSON lines over a Unix socket or stdin.
+# Deliberations that land within WINDOW seconds of each other are coalesced into one batched
+# 32D council evaluation (deliberate_batch); transfer windows are cached for TRANSFER_TTL seconds
+# Run: python -m quantum_mega_hybrid_v7.deploy_service [--socket /tmp/qmh7.sock]   (stdin JSON-lines otherwise)
+#      [--instrument] [--trace trace.json] [--profile service.prof]   (profile includes the evaluator thread)
+# Request:  {"id": 1, "op": "deliberate", "voters": 29, "seed": 7}  |  {"id": 2, "op": "transfer", "target": "Mars"}
+#           {"op": "ping"}  |  {"op": "stats"}  |  {"op": "metrics"}   (counters/spans with --instrument)
+# Response: {"id": 1, "ok": true, "result": {...}}  |  {"id": 1, "ok": false, "error": "..."}
+# Dependencies: numpy, astropy
+# MIT License — Infinite love victorious eternal ∞
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from quantum_mega_hybrid_v7 import instrumentation
+from quantum_mega_hybrid_v7.alchemist import MercyGate, council_size, deliberate_batch, transfer_window
+from quantum_mega_hybrid_v7.cayley_dickson import sign_table, structure_tensor
+
+# Coalescing window: long enough for concurrent clients to pile into one batch, short enough that a
+# lone request barely notices; MAX_BATCH bounds the (batch, voters, 32) shard array
+WINDOW = 0.002
+MAX_BATCH = 256
+# Chain norms grow ~e^(0.7·voters): 201 voters stays near 1e149, while N(x) = |x|² overflows from ~220
+MAX_VOTERS = 201
+# Earth–Venus/Mars separations drift well under 0.01° per minute
+TRANSFER_TTL = 60.0
+
+def _evaluate_batch(voters, seeds):
+    with instrumentation.span("service.batch"):
+        if instrumentation.ENABLED:
+            instrumentation.count("service.deliberations", len(voters))
+        with np.errstate(over="ignore", invalid="ignore"):  # overflowed rows are failed per request
+            return deliberate_batch(voters, seeds)
+
+class CouncilBatcher:
+    """Coalesce Concurrent Deliberations into One Batched Council Evaluation"""
+    def __init__(self, executor, window=WINDOW, max_batch=MAX_BATCH):
+        self.executor = executor
+        self.window = window
+        self.max_batch = max_batch
+        self.mercy = MercyGate()
+        self.pending = []
+        self.timer = None
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, voters, seed):
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((voters, seed, future))
+        if len(self.pending) >= self.max_batch:
+            self._flush()
+        elif self.timer is None:
+            self.timer = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return future
+
+    def _flush(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            asyncio.ensure_future(self._evaluate(batch))
+
+    async def _evaluate(self, batch):
+        voters = [v for v, _, _ in batch]
+        seeds = [s for _, s, _ in batch]
+        try:
+            norms = await asyncio.get_running_loop().run_in_executor(
+                self.executor, instrumentation.profile_call, _evaluate_batch, voters, seeds)
+        except Exception as exc:
+            if len(batch) > 1:  # isolate the culprit: only its own request may fail
+                await asyncio.gather(*(self._evaluate([item]) for item in batch))
+                return
+            future = batch[0][2]
+            if not future.done():  # client may have gone away mid-batch
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.requests += len(batch)
+        for (v, seed, future), norm in zip(batch, norms.tolist()):
+            if not math.isfinite(norm):
+                if not future.done():
+                    future.set_exception(ArithmeticError(f"council chain of {council_size(v)} voters overflowed"))
+                continue
+            mercy = self.mercy.intervenes(norm)
+            if not future.done():
+                future.set_result({"voters": council_size(v), "seed": seed, "norm": norm,
+                                   "harmony": 1.0 if mercy else norm, "mercy": mercy, "batch": len(batch)})
+
+class DeployService:
+    """Warm Alchemist — Shared Batcher, Ephemeris Cache and JSON-Lines Dispatch"""
+    def __init__(self, window=WINDOW, max_batch=MAX_BATCH):
+        self.executor = ThreadPoolExecutor(max_workers=1)  # one evaluator; requests queue behind it
+        self.batcher = CouncilBatcher(self.executor, window, max_batch)
+        self.transfers = {}
+        self.started = time.time()
+        self.warm_seconds = None
+
+    def warm(self):
+        """Pay every first-call cost up front: tables, kernel dispatch, ephemeris and erfa data"""
+        t0 = time.perf_counter()
+        sign_table("trigintaduonion")
+        structure_tensor("trigintaduonion")
+        deliberate_batch([29], [0])
+        for target in ("venus", "mars"):
+            self.transfers[target] = (time.time(), transfer_window(target))
+        self.warm_seconds = time.perf_counter() - t0
+
+    async def transfer(self, target):
+        """Cached separation while fresh; otherwise recomputed on the evaluator thread"""
+        key = target.lower()
+        cached = self.transfers.get(key)
+        if instrumentation.ENABLED:
+            instrumentation.count("service.transfers")
+        if cached is None or time.time() - cached[0] > TRANSFER_TTL:
+            now = time.time()
+            deg = await asyncio.get_running_loop().run_in_executor(
+                self.executor, instrumentation.profile_call, transfer_window, key)
+            cached = self.transfers[key] = (now, deg)
+        return {"target": target, "separation_deg": cached[1], "computed_at": cached[0]}
+
+    async def handle(self, request):
+        op = request.get("op")
+        if op == "deliberate":
+            voters = request.get("voters", 29)
+            if isinstance(voters, bool) or not isinstance(voters, int) or not 1 <= voters <= MAX_VOTERS:
+                raise ValueError(f"voters must be an integer in 1..{MAX_VOTERS}")
+            seed = request.get("seed")
+            if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or seed < 0):
+                raise ValueError("seed must be a non-negative integer or null")
+            return await self.batcher.submit(voters, seed)
+        if op == "transfer":
+            return await self.transfer(str(request.get("target", "Mars")))
+        if op == "ping":
+            return {"pong": True}
+        if op == "metrics":
+            return instrumentation.snapshot()
+        if op == "stats":
+            return {"uptime_s": time.time() - self.started, "warm_s": self.warm_seconds,
+                    "batches": self.batcher.batches, "deliberations": self.batcher.requests,
+                    "cached_transfers": sorted(self.transfers)}
+        raise ValueError(f"Unknown op {op!r}")
+
+    async def respond(self, line):
+        """One JSON line in, one JSON line out — errors become structured responses, never crashes"""
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id") if isinstance(request, dict) else None
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            response = {"id": request_id, "ok": True, "result": await self.handle(request)}
+            return json.dumps(response, allow_nan=False) + "\n"  # strict JSON: no NaN/Infinity tokens
+        except Exception as exc:
+            response = {"id": request_id, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        return json.dumps(response) + "\n"
+
+    async def serve_stream(self, reader, write, drain):
+        """Answer every line concurrently (so they can share a batch); responses carry their id"""
+        tasks = set()
+
+        async def answer(line):
+            write((await self.respond(line)).encode())
+            await drain()
+
+        while line := await reader.readline():
+            if line.strip():
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    async def serve_unix(self, path):
+        async def client(reader, writer):
+            try:
+                await self.serve_stream(reader, writer.write, writer.drain)
+            finally:
+                writer.close()
+
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(client, path=path)
+        print(f"Alchemist deploy service warm in {self.warm_seconds:.2f}s — listening on {path}",
+              file=sys.stderr, flush=True)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            os.unlink(path)
+
+    async def serve_stdin(self):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        out = sys.stdout.buffer
+
+        async def drain():
+            out.flush()
+
+        print(f"Alchemist deploy service warm in {self.warm_seconds:.2f}s — reading JSON lines from stdin",
+              file=sys.stderr, flush=True)
+        await self.serve_stream(reader, out.write, drain)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm-process alchemist deploy service")
+    parser.add_argument("--socket", help="Unix socket path (stdin JSON-lines when omitted)")
+    parser.add_argument("--window", type=float, default=WINDOW, help="coalescing window in seconds")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    parser.add_argument("--instrument", action="store_true", help="collect counters/spans (served by op metrics)")
+    parser.add_argument("--trace", metavar="PATH", help="Chrome trace written on shutdown (implies --instrument)")
+    parser.add_argument("--profile", metavar="PATH", help="run the whole service under cProfile, stats to PATH")
+    args = parser.parse_args(argv)
+
+    if args.instrument or args.trace:
+        instrumentation.enable()
+    service = DeployService(args.window, args.max_batch)
+    service.warm()
+    serve = lambda: asyncio.run(service.serve_unix(args.socket) if args.socket else service.serve_stdin())
+    try:
+        if args.profile:
+            instrumentation.profile_run(serve, args.profile)
+        else:
+            serve()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.executor.shutdown()
+        if args.trace:
+            instrumentation.write_chrome_trace(args.trace)
+
+if __name__ == "__main__":
+    main()
@@ -29,6 +29,9 @@ class Dual:
         dual = self.real * other.dual + self.dual * other.real
         return Dual(real, dual)
     
+    __radd__ = __add__
+    __rmul__ = __mul__  # Scalars commute with a + bε — lets 2*x work in f(x)
+    
     def __pow__(self, n):
         # Power via binomial (finite since nilpotent)
         if n == 0:
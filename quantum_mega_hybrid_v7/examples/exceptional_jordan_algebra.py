@@ -1,11 +1,13 @@
 # examples/exceptional_jordan_algebra.py — Exceptional Jordan Algebra J³(𝕆)
 # 27D Structure over Octonions — F4 Symmetry & Cubic Form Application
 # Physics Tie: Black hole charges, exceptional GUT models
-# Run: python quantum_mega_hybrid_v7/examples/exceptional_jordan_algebra.py
-# Dependencies: numpy (uses core Octonion class from alchemist.py or stubbed here)
+# Run: python -m quantum_mega_hybrid_v7.examples.exceptional_jordan_algebra
+# Dependencies: numpy (triple product via the sparse octonion fast path in sparse_hypercomplex.py)
 
 import numpy as np
 
+from quantum_mega_hybrid_v7.sparse_hypercomplex import SparseHypercomplex
+
 class Octonion:
     """Compact Octonion Stub for Jordan Elements (full mul from alchemist.py)"""
     def __init__(self, *args):
@@ -37,17 +39,17 @@ class JordanElement:
         return np.dot(self.diag, self.diag) + 2 * sum(o.c.dot(o.c) for o in self.off)
     
     def freudenthal_det(self):
-        """Cubic Determinant det(A) — F4 Invariant (Simplified Formula)"""
+        """Cubic Determinant det(A) — F4 Invariant (Freudenthal Formula)"""
         a, b, g = self.diag  # α, β, γ
         x, y, z = self.off
-        # Full det = αβγ - α|x|² - β|y|² - γ|z|² + Re(x ◦ (y × z)*) etc.
-        # Standard formula involves octonion triple product
+        # det = αβγ - α|z|² - β|y|² - γ|x|² + 2 Re((x z) ȳ)  for x = A₁₂, y = A₁₃, z = A₂₃
         norm_x = x.c.dot(x.c)
         norm_y = y.c.dot(y.c)
         norm_z = z.c.dot(z.c)
-        # Triple term stub (requires full oct mul/associator)
-        triple = 0.0  # Placeholder — real impl uses (x (y* z) + cyclic)/2 Re part
-        det = a*b*g - a*norm_y - b*norm_z - g*norm_x + triple
+        # Off-diagonals are typically basis-like (e.g. [1.0]+[0]*7): products cost nnz(x)·nnz(z)
+        sx, sy, sz = (SparseHypercomplex.from_dense("octonion", o.c) for o in (x, y, z))
+        triple = 2.0 * (sx * sz * sy.conj()).to_dense()[0]
+        det = a*b*g - a*norm_z - b*norm_y - g*norm_x + triple
         return det
     
     def __repr__(self):
@@ -64,6 +66,6 @@ if __name__ == "__main__":
     print(f"Diagonal Element: {elem_diag}")
     print(f"Trace: {elem_diag.trace():.2f}")
     print(f"Off-Diagonal e1: {elem_off}")
-    print(f"Approximate Det (stub triple=0): {elem_off.freudenthal_det():.2f}")
+    print(f"Freudenthal Det (full triple term): {elem_off.freudenthal_det():.2f}")
     print("Exceptional Jordan Algebra Constructed — 27D F4 Harmony Eternal!")
     print("Infinite love — victorious eternal 🔥🫡💛")
@@ -1,38 +1,32 @@
 # examples/magic_square_algebras.py — Freudenthal-Tits Magic Square
 # Unified Exceptional Lie Algebras via Composition & Jordan Algebras
 # Physics Tie: Exceptional symmetry origins, GUT patterns
-# Run: python quantum_mega_hybrid_v7/examples/magic_square_algebras.py
-# Dependencies: none (pure print visualization)
+# Run: python -m quantum_mega_hybrid_v7.examples.magic_square_algebras
+# Dependencies: numpy, scipy (algebras built via tits_construction.py, cached after first run)
+
+from quantum_mega_hybrid_v7.tits_construction import COMPOSITION, magic_square
+
+SYMBOLS = {"real": "ℝ", "complex": "ℂ", "quaternion": "ℍ", "octonion": "𝕆"}
 
 def print_magic_square():
-    """Visualize the Freudenthal-Tits Magic Square"""
-    algebras = [
-        ["", "ℝ", "ℂ", "ℍ", "𝕆"],
-        ["ℝ", "A1 = sl(2)", "A2 = sl(3)", "C3 = sp(6)", "F4"],
-        ["ℂ", "A2 = sl(3)", "A2 ⊕ A2", "A5 = sl(6)", "E6"],
-        ["ℍ", "C3 = sp(6)", "A5 = sl(6)", "D6 = so(12)", "E7"],
-        ["𝕆", "F4", "E6", "E7", "E8"]
-    ]
-    
-    dims = [
-        ["", "1D", "2D", "4D", "8D"],
-        ["1D", "(dim 3)", "(dim 8)", "(dim 21)", "(dim 52)"],
-        ["2D", "(dim 8)", "(dim 8+8)", "(dim 35)", "(dim 78)"],
-        ["4D", "(dim 21)", "(dim 35)", "(dim 66)", "(dim 133)"],
-        ["8D", "(dim 52)", "(dim 78)", "(dim 133)", "(dim 248)"]
-    ]
+    """Build and Visualize the Freudenthal-Tits Magic Square — Dimensions From the Data"""
+    square = magic_square()
     
     print("Freudenthal-Tits Magic Square — Exceptional Lie Algebras Unified!")
-    print("Rows/Columns: Division Algebras (ℝ, ℂ, ℍ, 𝕆)")
-    print("\nLie Algebras:")
-    for row in algebras:
-        print(" | ".join(f"{cell:<20}" for cell in row))
+    print("Rows: Composition Algebra A | Columns: Jordan Algebra H₃(B)")
+    print("\nLie Algebras (dim = Der(A) + A₀⊗J₀ + Der(J), counted from structure constants):")
+    print(" | ".join(f"{cell:<20}" for cell in [""] + [SYMBOLS[c] for c in COMPOSITION]))
+    for r in COMPOSITION:
+        cells = [SYMBOLS[r]] + [f"{square[(r, c)].name} (dim {square[(r, c)].dim})" for c in COMPOSITION]
+        print(" | ".join(f"{cell:<20}" for cell in cells))
     
-    print("\nApproximate Dimensions:")
-    for row in dims:
-        print(" | ".join(f"{cell:<20}" for cell in row))
+    print("\nStructure Checks (Jacobi residual, Cartan semisimplicity):")
+    for (r, c), alg in square.items():
+        print(f"{SYMBOLS[r]} × {SYMBOLS[c]}: {alg.name:<6} nnz={alg.nnz:<6} "
+              f"Jacobi={alg.jacobi_residual(2):.1e} semisimple={alg.is_semisimple()}")
     
-    print("\nE8 Pinnacle: 248D — Ultimate Exceptional Symmetry Eternal!")
+    e8 = square[("octonion", "octonion")]
+    print(f"\nE8 Pinnacle: {e8.dim}D — Ultimate Exceptional Symmetry Eternal!")
     print("Infinite love — victorious eternal 🔥🫡💛")
 
 if __name__ == "__main__":
@@ -1,28 +1,32 @@
 # examples/magic_triangle_structures.py — Magic Triangle Structures
 # Triangular Array of Exceptional Lie Groups (Cvitanović/Deligne Style)
 # Physics Tie: Diophantine dimension harmony, E8 unification pinnacle
-# Run: python quantum_mega_hybrid_v7/examples/magic_triangle_structures.py
-# Dependencies: none (ASCII visualization)
+# Run: python -m quantum_mega_hybrid_v7.examples.magic_triangle_structures
+# Dependencies: numpy, scipy (algebras built via tits_construction.py, cached after first run)
+
+from quantum_mega_hybrid_v7.tits_construction import derivation_algebra, tits_algebra
 
 def print_magic_triangle():
-    """Visualize the Core Magic Triangle of Exceptional Lie Algebras"""
+    """Visualize the Core Magic Triangle of Exceptional Lie Algebras — Built, Not Hard-Coded"""
+    g2 = derivation_algebra("octonion")  # G2 = Der(𝕆)
+    f4, e6, e7, e8 = (tits_algebra(r, "octonion") for r in ("real", "complex", "quaternion", "octonion"))
     triangle = [
-        ["                  G2 (14)                  "],
-        ["             F4 (52)         E6 (78)        "],
-        ["        E7 (133)         E7 (133)        E8 (248)"],
-        ["   (Intermediate extensions possible with ternions/sextonions)"],
+        [f"{g2.name} ({g2.dim})"],
+        [f"{f4.name} ({f4.dim})", f"{e6.name} ({e6.dim})"],
+        [f"{e7.name} ({e7.dim})", f"{e8.name} ({e8.dim})"],
+        ["(Intermediate extensions possible with ternions/sextonions)"],
     ]
     
-    dims_note = "(Dimensions of compact real forms — adjoint representations)"
+    dims_note = "(Dimensions counted from generated structure constants — adjoint representations)"
     
     print("Magic Triangle Structures — Exceptional Lie Series in Triangular Harmony!")
     print("Extension of Freudenthal-Tits Magic Square (Diophantine/Birdtrack Invariants)")
     print(dims_note)
     print("\nCore Triangle:")
     for row in triangle:
-        print(" ".join(row).center(80))
+        print("         ".join(row).center(80))
     
-    print("\nE8 Pinnacle: 248D — Ultimate Exceptional Unification Eternal!")
+    print(f"\nE8 Pinnacle: {e8.dim}D — Ultimate Exceptional Unification Eternal!")
     print("Infinite love — victorious eternal 🔥🫡💛")
 
 if __name__ == "__main__":
@@ -2,44 +2,39 @@
 # 7D Vector Rotations via G2 (Exceptional Group Preservation)
 # Physics Tie: Norm-preserving rotations in 7D imaginary space — relevant to
 # exceptional Lie groups (G2), string theory extra dimensions, triality models
-# Run: python quantum_mega_hybrid_v7/examples/octonion_physics_7d_rotation.py
-# Dependencies: numpy
+# Run: python -m quantum_mega_hybrid_v7.examples.octonion_physics_7d_rotation
+# Dependencies: numpy (shared Fano kernel from cayley_dickson.py; torch tensors accepted)
 
 import numpy as np
 
+from quantum_mega_hybrid_v7.backend import asarray, get_backend
+from quantum_mega_hybrid_v7.cayley_dickson import conjugate, multiply, structure_tensor
+
+OCTONION_TABLE = structure_tensor("octonion")
+
 class Octonion:
     """Full Octonion Class with Physics Rotation Support"""
     def __init__(self, *args):
         if len(args) == 1 and hasattr(args[0], '__len__'):
-            self.c = np.array(args[0], dtype=float).reshape(8)
+            self.c = asarray(args[0]).reshape(8)
         else:
-            self.c = np.zeros(8)
+            self.c = get_backend().zeros(8)
             for i, v in enumerate(args[:8]):
                 self.c[i] = float(v)
     
     def __mul__(self, other):
         if not isinstance(other, Octonion):
             return Octonion(self.c * other)
-        a, b = self.c, other.c
-        r = np.zeros(8)
-        r[0] = a[0]*b[0] - a[1]*b[1] - a[2]*b[2] - a[3]*b[3] - a[4]*b[4] - a[5]*b[5] - a[6]*b[6] - a[7]*b[7]
-        r[1] = a[0]*b[1] + a[1]*b[0] + a[2]*b[3] - a[3]*b[2] + a[4]*b[5] - a[5]*b[4] - a[6]*b[7] + a[7]*b[6]
-        r[2] = a[0]*b[2] - a[1]*b[3] + a[2]*b[0] + a[3]*b[1] + a[4]*b[6] + a[5]*b[7] - a[6]*b[4] - a[7]*b[5]
-        r[3] = a[0]*b[3] + a[1]*b[2] - a[2]*b[1] + a[3]*b[0] + a[4]*b[7] - a[5]*b[6] + a[6]*b[5] - a[7]*b[4]
-        r[4] = a[0]*b[4] - a[1]*b[5] - a[2]*b[6] - a[3]*b[7] + a[4]*b[0] + a[5]*b[1] + a[6]*b[2] + a[7]*b[3]
-        r[5] = a[0]*b[5] + a[1]*b[4] - a[2]*b[7] + a[3]*b[6] - a[4]*b[1] + a[5]*b[0] - a[6]*b[3] + a[7]*b[2]
-        r[6] = a[0]*b[6] + a[1]*b[7] + a[2]*b[4] - a[3]*b[5] - a[4]*b[2] + a[5]*b[3] + a[6]*b[0] - a[7]*b[1]
-        r[7] = a[0]*b[7] - a[1]*b[6] + a[2]*b[5] + a[3]*b[4] - a[4]*b[3] - a[5]*b[2] + a[6]*b[1] + a[7]*b[0]
-        return Octonion(r)
+        return Octonion(multiply(self.c, other.c, OCTONION_TABLE))
     
     def conj(self):
-        c = self.c.copy(); c[1:] *= -1; return Octonion(c)
+        return Octonion(conjugate(self.c))
     
     def norm_sq(self):
-        return np.dot(self.c, self.c)
+        return (self.c * self.c).sum()
     
     def norm(self):
-        return np.sqrt(self.norm_sq())
+        return self.norm_sq() ** 0.5
     
     def inverse(self):
         n2 = self.norm_sq()
@@ -50,12 +45,12 @@ class Octonion:
     def normalize(self):
         n = self.norm()
         if n > 1e-10:
-            self.c /= n
+            self.c = self.c / n  # Rebind — storage may be shared with the caller (zero-copy)
     
     def rotate_7d_vector(self, vec7):
         """Rotate pure imaginary 7D vector (np.array[7]) via G2 action"""
         # Embed vector as pure imaginary octonion (scalar 0)
-        v = Octonion(np.concatenate([[0.0], vec7]))
+        v = Octonion(np.concatenate([[0.0], np.asarray(vec7, dtype=float)]))
         # Ensure unit rotator
         u = Octonion(self.c)
         u.normalize()
@@ -1,11 +1,15 @@
 # examples/quaternion_3d_rotation.py — Practical Quaternion Application
 # 4D Hypercomplex for Gimbal-Lock-Free 3D Rotations (Space Habitats/Drones/Robotics)
-# Run: python quantum_mega_hybrid_v7/examples/quaternion_3d_rotation.py
-# Dependencies: numpy
+# Run: python -m quantum_mega_hybrid_v7.examples.quaternion_3d_rotation
+# Dependencies: numpy (shared Hamilton kernel from cayley_dickson.py)
 # Use: Orient geodesic domes/orbital modules in Venus/Mars transfers mercy-seeded
 
 import numpy as np
 
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+
+QUATERNION_TABLE = structure_tensor("quaternion")
+
 class Quaternion:
     """Simple Quaternion Class for Rotation Applications"""
     def __init__(self, w=1.0, x=0.0, y=0.0, z=0.0):
@@ -21,13 +25,7 @@ class Quaternion:
         return Quaternion(w, *xyz)
     
     def multiply(self, other):
-        w1, x1, y1, z1 = self.q
-        w2, x2, y2, z2 = other.q
-        w = w1*w2 - x1*x2 - y1*y2 - z1*z2
-        x = w1*x2 + x1*w2 + y1*z2 - z1*y2
-        y = w1*y2 - x1*z2 + y1*w2 + z1*x2
-        z = w1*z2 + x1*y2 - y1*x2 + z1*w2
-        return Quaternion(w, x, y, z)
+        return Quaternion(*multiply(self.q, other.q, QUATERNION_TABLE))
     
     def rotate_vector(self, v):
         """Rotate 3D vector v (np.array) using this quaternion"""
@@ -1,12 +1,16 @@
 # examples/quaternion_linear_layer.py — Emerging Hypercomplex ML Application
 # Quaternion-Valued Linear Layer (Reduced Parameters for Image/Signal Processing)
-# Run: python quantum_mega_hybrid_v7/examples/quaternion_linear_layer.py
-# Dependencies: torch
+# Run: python -m quantum_mega_hybrid_v7.examples.quaternion_linear_layer
+# Dependencies: torch, numpy (shared Hamilton kernel from cayley_dickson.py — zero-copy on tensors)
 # Use: Efficient hypercomplex neural nets (e.g., color image processing with 4 channels)
 
 import torch
 import torch.nn as nn
 
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+
+QUATERNION_TABLE = structure_tensor("quaternion")
+
 class QuaternionLinear(nn.Module):
     """Simple Quaternion Linear Layer — Hamilton Product for Parameter Efficiency"""
     def __init__(self, in_features, out_features):
@@ -17,13 +21,7 @@ class QuaternionLinear(nn.Module):
     
     def hamilton_product(self, a, b):
         """Hamilton product for two quaternion tensors (batch, features, 4)"""
-        ar, ai, aj, ak = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
-        br, bi, bj, bk = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
-        out_r = ar*br - ai*bi - aj*bj - ak*bk
-        out_i = ar*bi + ai*br + aj*bk - ak*bj
-        out_j = ar*bj - ai*bk + aj*br + ak*bi
-        out_k = ar*bk + ai*bj - aj*bi + ak*br
-        return torch.stack([out_r, out_i, out_j, out_k], dim=-1)
+        return multiply(a, b, QUATERNION_TABLE)
     
     def forward(self, x):
         # x: (batch, in_features, 4) quaternion input
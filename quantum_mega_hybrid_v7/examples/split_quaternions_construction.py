@@ -14,9 +14,9 @@ def matrix_example():
     q = np.array([[0.5, 1.0], [0.0, 0.5]])  # det = 0.25
     
     product = p @ q  # Matrix multiplication
-    det_p = np.det(p)
-    det_q = np.det(q)
-    det_product = np.det(product)
+    det_p = np.linalg.det(p)
+    det_q = np.linalg.det(q)
+    det_product = np.linalg.det(product)
     
     print(f"P matrix:\n{p}")
     print(f"Norm (det P): {det_p:.2f}")
@@ -28,7 +28,7 @@ def matrix_example():
     # Zero divisor example (singular non-zero matrix)
     singular = np.array([[1.0, 1.0], [1.0, 1.0]])  # rank 1, det=0
     print(f"\nZero Divisor Matrix:\n{singular}")
-    print(f"Norm (det): {np.det(singular):.2f} — Lightlike Non-Invertible!")
+    print(f"Norm (det): {np.linalg.det(singular):.2f} — Lightlike Non-Invertible!")
 
 # Construction 2: Cayley-Dickson from Split-Complex (Simplified Pair Stub)
 class SplitComplex:
@@ -36,6 +36,9 @@ class SplitComplex:
         self.real = real
         self.hyper = hyper
     
+    def __add__(self, other):
+        return SplitComplex(self.real + other.real, self.hyper + other.hyper)
+    
     def conj(self):
         return SplitComplex(self.real, -self.hyper)
     
@@ -60,7 +63,7 @@ class SplitQuaternionCD:
         return SplitQuaternionCD(self.p.real, self.p.hyper, -self.q.real, -self.q.hyper)
     
     def norm(self):
-        return self.p.norm() + self.q.norm()  # Indefinite overall
+        return self.p.norm() - self.q.norm()  # N(p) − γ N(q), γ = +1 — indefinite, multiplicative
     
     def __mul__(self, other):
         # (p, q) * (r, s) = (p r + s* q, p s + q r*)
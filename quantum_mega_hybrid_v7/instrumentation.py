@@ -0,0 +1,152 @@
+# instrumentation.py — Opt-In Counters, Nested Spans & Profiling Hooks
+# Off by default: every call site is guarded by `if instrumentation.ENABLED`, so a disabled run pays
+# one module-attribute check per kernel call and spans collapse to a shared no-op context
+# Enable with QMH7_INSTRUMENT=1 or enable(); export via snapshot() (dict), to_json(), write_chrome_trace()
+# (load the trace in chrome://tracing or ui.perfetto.dev); profile_run() wraps any entry point in cProfile,
+# profile_call() folds work run on executor threads into the same stats
+# Dependencies: none (standard library)
+# MIT License — Infinite love victorious eternal ∞
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+
+ENABLED = os.environ.get("QMH7_INSTRUMENT", "") not in ("", "0")
+
+_lock = threading.Lock()
+_local = threading.local()
+_counters = {}
+_events = []   # (path, start_ns, duration_ns, thread id) per closed span
+_origin = time.perf_counter_ns()
+_NULL = contextlib.nullcontext()
+_worker_profiles = None  # per-call profilers from other threads while profile_run is active
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+def disable():
+    global ENABLED
+    ENABLED = False
+
+def reset():
+    """Drop every counter and span recorded so far"""
+    global _origin
+    with _lock:
+        _counters.clear()
+        _events.clear()
+        _origin = time.perf_counter_ns()
+
+def count(name, n=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+def record_multiply(dim, products, arrays, nbytes):
+    """One kernel call: products by algebra dimension plus the arrays it allocated"""
+    with _lock:
+        key = f"multiply.{dim}D"
+        _counters[key] = _counters.get(key, 0) + products
+        _counters["alloc.arrays"] = _counters.get("alloc.arrays", 0) + arrays
+        _counters["alloc.bytes"] = _counters.get("alloc.bytes", 0) + nbytes
+
+class _Span:
+    __slots__ = ("name", "path", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _local.stack.pop()
+        with _lock:
+            _events.append((self.path, self.start, end - self.start, threading.get_ident()))
+        return False
+
+def span(name):
+    """Timed, nestable stage — `with span("chain"): ...`; a shared no-op when disabled"""
+    return _Span(name) if ENABLED else _NULL
+
+def snapshot():
+    """Counters plus per-path span totals (count, total/max seconds) as a plain dict"""
+    with _lock:
+        counters = dict(_counters)
+        events = list(_events)
+    spans = {}
+    for path, _, duration, _ in events:
+        entry = spans.setdefault(path, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+        entry["count"] += 1
+        entry["total_s"] += duration * 1e-9
+        entry["max_s"] = max(entry["max_s"], duration * 1e-9)
+    return {"enabled": ENABLED, "counters": dict(sorted(counters.items())), "spans": dict(sorted(spans.items()))}
+
+def to_json(path=None):
+    """snapshot() as JSON text, also written to `path` when given"""
+    text = json.dumps(snapshot(), indent=2)
+    if path:
+        with open(path, "w") as fh:
+            fh.write(text)
+    return text
+
+def write_chrome_trace(path):
+    """Complete ("X") events in Chrome trace format — nesting is recovered from the timestamps"""
+    with _lock:
+        events = list(_events)
+        counters = dict(_counters)
+        origin = _origin
+    pid = os.getpid()
+    trace = [{"name": p.rsplit("/", 1)[-1], "cat": p, "ph": "X", "pid": pid, "tid": tid,
+              "ts": (start - origin) / 1e3, "dur": duration / 1e3}
+             for p, start, duration, tid in events]
+    if events:
+        end = max(start + duration for _, start, duration, _ in events)
+        trace.append({"name": "counters", "ph": "C", "pid": pid, "tid": 0, "ts": (end - origin) / 1e3,
+                      "args": counters})
+    with open(path, "w") as fh:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, fh)
+
+def profile_call(fn, *args):
+    """fn(*args) on a worker thread — under its own profiler, merged into the stats, while profile_run is active"""
+    profiles = _worker_profiles
+    if profiles is None:
+        return fn(*args)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn, *args)
+    finally:
+        with _lock:
+            profiles.append(profiler)
+
+def profile_run(fn, path, top=25):
+    """Run fn() under cProfile: binary stats to `path` (snakeviz/pstats), top entries to stderr
+    (cProfile sees only the calling thread; worker threads contribute through profile_call)"""
+    global _worker_profiles
+    profiler = cProfile.Profile()
+    _worker_profiles = []
+    try:
+        return profiler.runcall(fn)
+    finally:
+        with _lock:
+            workers, _worker_profiles = _worker_profiles, None
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        for worker in workers:
+            stats.add(worker)
+        stats.dump_stats(path)
+        stats.sort_stats("cumulative").print_stats(top)
+        print(report.getvalue(), file=sys.stderr)
+        print(f"Profile written to {path}", file=sys.stderr)
@@ -0,0 +1,175 @@
+# nonassociativity.py — Vectorized Non-Associativity Analytics
+# Batched associators, commutators, alternativity/Moufang residuals & norm defects
+# over (N, dim) shard batches via the precomputed Cayley-Dickson structure tensor
+# Run: python -m quantum_mega_hybrid_v7.nonassociativity sedenion --samples 10000000 --workers 8
+# Dependencies: numpy
+# MIT License — Infinite love victorious eternal ∞
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from quantum_mega_hybrid_v7.cayley_dickson import ALGEBRAS, multiply, norm_sq, structure_tensor
+
+RESIDUALS = ("commutator", "associator", "left_alternative", "right_alternative",
+             "flexible", "moufang", "norm_defect")
+
+def commutator(a, b, table):
+    """[a, b] = ab − ba over (N, d) batches"""
+    return multiply(a, b, table) - multiply(b, a, table)
+
+def associator(a, b, c, table):
+    """[a, b, c] = (ab)c − a(bc) over (N, d) batches"""
+    return multiply(multiply(a, b, table), c, table) - multiply(a, multiply(b, c, table), table)
+
+def moufang_residual(a, b, c, table):
+    """Left Moufang identity a(b(ac)) − ((ab)a)c — zero in every alternative algebra"""
+    ac = multiply(a, c, table)
+    aba = multiply(multiply(a, b, table), a, table)
+    return multiply(a, multiply(b, ac, table), table) - multiply(aba, c, table)
+
+def norm_defect(a, b, table, name):
+    """N(ab) − N(a)N(b) — zero exactly for composition algebras"""
+    return norm_sq(multiply(a, b, table), name) - norm_sq(a, name) * norm_sq(b, name)
+
+def residuals(a, b, c, name):
+    """Scale-free residual magnitudes per sample — shared products computed once"""
+    table = structure_tensor(name)
+    na, nb, nc = (np.linalg.norm(x, axis=-1) for x in (a, b, c))
+    ab = multiply(a, b, table)
+    ba = multiply(b, a, table)
+    aa = multiply(a, a, table)
+    bb = multiply(b, b, table)
+    ac = multiply(a, c, table)
+    aba = multiply(ab, a, table)
+    out = {
+        "commutator": ab - ba,
+        "associator": multiply(ab, c, table) - multiply(a, multiply(b, c, table), table),
+        "left_alternative": multiply(aa, b, table) - multiply(a, ab, table),
+        "right_alternative": multiply(ab, b, table) - multiply(a, bb, table),
+        "flexible": aba - multiply(a, ba, table),
+        "moufang": multiply(a, multiply(b, ac, table), table) - multiply(aba, c, table),
+    }
+    scale = {
+        "commutator": na * nb,
+        "associator": na * nb * nc,
+        "left_alternative": na * na * nb,
+        "right_alternative": na * nb * nb,
+        "flexible": na * nb * na,
+        "moufang": na * na * nb * nc,
+    }
+    mags = {key: np.linalg.norm(val, axis=-1) / scale[key] for key, val in out.items()}
+    defect = norm_sq(ab, name) - norm_sq(a, name) * norm_sq(b, name)
+    mags["norm_defect"] = np.abs(defect) / (na * na * nb * nb)
+    return mags
+
+class ResidualHistogram:
+    """Streaming Log-Binned Histogram — Fixed Edges, Mergeable Across Chunks & Workers"""
+    def __init__(self, lo=1e-18, hi=1e3, bins=336):
+        self.edges = np.logspace(np.log10(lo), np.log10(hi), bins + 1)
+        self.counts = np.zeros(bins + 2, dtype=np.int64)  # [underflow, bins..., overflow]
+        self.n = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.max = 0.0
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        idx = np.searchsorted(self.edges, values, side="right")
+        self.counts += np.bincount(idx, minlength=self.counts.size)
+        self.n += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.dot(values, values))
+        self.max = max(self.max, float(values.max()))
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Histogram edges differ — cannot merge")
+        self.counts += other.counts
+        self.n += other.n
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.max = max(self.max, other.max)
+        return self
+
+    def mean(self):
+        return self.total / self.n if self.n else 0.0
+
+    def std(self):
+        if not self.n:
+            return 0.0
+        return float(np.sqrt(max(self.total_sq / self.n - self.mean() ** 2, 0.0)))
+
+    def quantile(self, q):
+        """Approximate quantile — geometric midpoint of the bin holding rank q·n"""
+        if not self.n:
+            return 0.0
+        k = np.searchsorted(np.cumsum(self.counts), q * self.n, side="left")
+        if k == 0:
+            return 0.0
+        if k == self.counts.size - 1:
+            return self.max
+        return min(float(np.sqrt(self.edges[k - 1] * self.edges[k])), self.max)
+
+    def to_dict(self):
+        return {"n": self.n, "mean": self.mean(), "std": self.std(), "max": self.max,
+                "p50": self.quantile(0.5), "p99": self.quantile(0.99),
+                "edges": self.edges.tolist(), "counts": self.counts.tolist()}
+
+def _default_chunk(dim):
+    # Keep the (chunk, d²) outer-product intermediate near 32 MB
+    return max(1024, (1 << 22) // (dim * dim))
+
+def _survey_chunk(name, n, seed):
+    rng = np.random.default_rng(seed)
+    dim = structure_tensor(name).shape[0]
+    a, b, c = rng.standard_normal((3, n, dim))
+    hists = {key: ResidualHistogram() for key in RESIDUALS}
+    for key, mags in residuals(a, b, c, name).items():
+        hists[key].update(mags)
+    return hists
+
+def survey(name="sedenion", samples=1_000_000, chunk=None, seed=0, workers=1):
+    """Stream Gaussian triples through every residual — O(chunk) memory for any N"""
+    dim = structure_tensor(name).shape[0]
+    chunk = chunk or _default_chunk(dim)
+    sizes = [chunk] * (samples // chunk) + ([samples % chunk] if samples % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    totals = {key: ResidualHistogram() for key in RESIDUALS}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(_survey_chunk, [name] * len(sizes), sizes, seeds,
+                             chunksize=max(1, len(sizes) // (4 * workers)))
+            for part in parts:
+                for key in RESIDUALS:
+                    totals[key].merge(part[key])
+    else:
+        for n, s in zip(sizes, seeds):
+            part = _survey_chunk(name, n, s)
+            for key in RESIDUALS:
+                totals[key].merge(part[key])
+    return totals
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Non-associativity survey over random shards")
+    parser.add_argument("algebra", nargs="?", default="sedenion", choices=sorted(ALGEBRAS))
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--chunk", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    stats = survey(args.algebra, args.samples, args.chunk, args.seed, args.workers)
+    print(f"Non-Associativity Survey — {args.algebra} ({args.samples:,} triples, relative residuals)")
+    print(f"{'residual':<18} {'mean':>11} {'p50':>11} {'p99':>11} {'max':>11}")
+    for key in RESIDUALS:
+        h = stats[key]
+        print(f"{key:<18} {h.mean():11.3e} {h.quantile(0.5):11.3e} {h.quantile(0.99):11.3e} {h.max:11.3e}")
+    print("Infinite love — victorious eternal 🔥🫡💛")
+
+if __name__ == "__main__":
+    main()
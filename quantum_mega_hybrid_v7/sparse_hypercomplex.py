@@ -0,0 +1,127 @@
+# sparse_hypercomplex.py — Sparse Fast Path for Low-Support Hypercomplex Elements
+# (index, value) arrays with e_i e_j = sign[i, j] e_(i XOR j) looked up from the precomputed table:
+# sparse × sparse costs nnz(a)·nnz(b), sparse × dense costs nnz·d, instead of the dense d² contraction
+# Dependencies: numpy
+# MIT License — Infinite love victorious eternal ∞
+
+import numpy as np
+
+from quantum_mega_hybrid_v7 import instrumentation
+from quantum_mega_hybrid_v7.backend import asarray, is_tensor
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, sign_table, structure_tensor
+
+# Operands at or below this density take the sparse path (8 of 64 at 64D, 16 of 128 at 128D).
+# Below SPARSE_MIN_DIM the dense contraction is within the fixed cost of the index bookkeeping
+# (32D: ~10 µs dense against ~8 µs sparse even at nnz 1 × 1), so small algebras always go dense
+SPARSE_DENSITY = 0.125
+SPARSE_MIN_DIM = 64
+
+class SparseHypercomplex:
+    """Low-Support Cayley-Dickson Element — Sorted Index + Value Arrays"""
+    __slots__ = ("name", "dim", "index", "values")
+    __array_ufunc__ = None  # ndarray * sparse defers to __rmul__ instead of broadcasting over the object
+
+    def __init__(self, name, index, values, dim=None):
+        self.name = name
+        self.dim = dim if dim is not None else sign_table(name).shape[0]
+        self.index = np.asarray(index, dtype=np.intp)
+        self.values = np.asarray(values, dtype=float)
+
+    @classmethod
+    def from_dense(cls, name, coeffs):
+        coeffs = np.asarray(coeffs, dtype=float)
+        index = np.flatnonzero(coeffs)
+        return cls(name, index, coeffs[index], coeffs.shape[-1])
+
+    @classmethod
+    def basis(cls, name, i, value=1.0):
+        return cls(name, [i], [value])
+
+    @property
+    def nnz(self):
+        return self.index.size
+
+    @property
+    def density(self):
+        return self.nnz / self.dim
+
+    def to_dense(self):
+        out = np.zeros(self.dim)
+        out[self.index] = self.values
+        return out
+
+    def conj(self):
+        return SparseHypercomplex(self.name, self.index, np.where(self.index == 0, self.values, -self.values), self.dim)
+
+    def norm_sq(self):
+        return float(np.dot(self.values, self.values))
+
+    def __mul__(self, other):
+        if isinstance(other, SparseHypercomplex):
+            return sparse_sparse(self, other)
+        if np.isscalar(other):
+            return SparseHypercomplex(self.name, self.index, self.values * other, self.dim)
+        return sparse_dense(self, other)
+
+    def __rmul__(self, other):
+        if np.isscalar(other):
+            return self * other
+        return dense_sparse(other, self)
+
+    def __repr__(self):
+        terms = ", ".join(f"{v:.4g}·e{i}" for i, v in zip(self.index.tolist(), self.values.tolist()))
+        return f"Sparse{self.name.capitalize()}({terms})"
+
+def _sparse_product(name, ia, va, ib, vb, dim):
+    """Dense (dim,) Σ sign[i, j] v_i v_j e_(i XOR j) over the nnz(a)·nnz(b) pairs — one bincount"""
+    terms = sign_table(name)[ia[:, None], ib] * np.outer(va, vb)
+    return np.bincount((ia[:, None] ^ ib).ravel(), terms.ravel(), minlength=dim)
+
+def sparse_sparse(a, b):
+    """nnz(a)·nnz(b) products, duplicate targets accumulated"""
+    dense = _sparse_product(a.name, a.index, a.values, b.index, b.values, a.dim)
+    index = np.flatnonzero(dense)
+    return SparseHypercomplex(a.name, index, dense[index], a.dim)
+
+def sparse_dense(a, b):
+    """(Σ v_i e_i) b — one signed permutation of b per non-zero of a"""
+    return _sparse_dense(a.name, a.index, a.values, np.asarray(b, dtype=float))
+
+def dense_sparse(a, b):
+    """a (Σ v_j e_j) — one signed permutation of a per non-zero of b"""
+    return _dense_sparse(b.name, np.asarray(a, dtype=float), b.index, b.values)
+
+def _sparse_dense(name, ia, va, b):
+    perm = np.arange(b.shape[-1]) ^ ia[:, None]      # row r: j = i_r XOR k feeds output k
+    terms = va[:, None] * sign_table(name)[ia[:, None], perm] * b[perm]
+    return terms.sum(axis=0).astype(b.dtype, copy=False)
+
+def _dense_sparse(name, a, ib, vb):
+    perm = np.arange(a.shape[-1]) ^ ib[:, None]      # row r: i = j_r XOR k feeds output k
+    terms = vb[:, None] * sign_table(name)[perm, ib[:, None]] * a[perm]
+    return terms.sum(axis=0).astype(a.dtype, copy=False)
+
+def auto_multiply(a, b, name):
+    """Single-element product choosing sparse or dense kernels by operand density (dtype kept)"""
+    if is_tensor(a) or is_tensor(b) or np.ndim(a) != 1 or np.ndim(b) != 1:
+        return multiply(a, b, structure_tensor(name))
+    if np.shape(a)[-1] < SPARSE_MIN_DIM:
+        return multiply(a, b, structure_tensor(name))
+    a, b = asarray(a), asarray(b)            # float arrays pass through: float32 stays float32
+    d = a.shape[-1]
+    limit = SPARSE_DENSITY * d
+    sparse_a, sparse_b = np.count_nonzero(a) <= limit, np.count_nonzero(b) <= limit
+    if not (sparse_a or sparse_b):
+        return multiply(a, b, structure_tensor(name))  # dense × dense: no index work, counted in the kernel
+    if sparse_a and sparse_b:
+        ia, ib = np.flatnonzero(a), np.flatnonzero(b)
+        out = _sparse_product(name, ia, a[ia], ib, b[ib], d).astype(np.result_type(a, b), copy=False)
+    elif sparse_a:
+        ia = np.flatnonzero(a)
+        out = _sparse_dense(name, ia, a[ia], b)
+    else:
+        ib = np.flatnonzero(b)
+        out = _dense_sparse(name, a, ib, b[ib])
+    if instrumentation.ENABLED:
+        instrumentation.record_multiply(out.shape[-1], 1, 1, out.nbytes)
+    return out
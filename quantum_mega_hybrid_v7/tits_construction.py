@@ -0,0 +1,262 @@
+# tits_construction.py — Freudenthal-Tits Magic Square from First Principles
+# L(A, J) = Der(A) ⊕ (A₀ ⊗ J₀) ⊕ Der(J) for A ∈ {ℝ, ℂ, ℍ, 𝕆}, J = H₃(B), B ∈ {ℝ, ℂ, ℍ, 𝕆}
+# Structure constants stored as sparse COO tensors, cached on disk after the first build
+# Dependencies: numpy, scipy
+# MIT License — Infinite love victorious eternal ∞
+
+import os
+
+import numpy as np
+from scipy import linalg, sparse
+
+from quantum_mega_hybrid_v7.cayley_dickson import conjugate, structure_tensor
+
+COMPOSITION = ("real", "complex", "quaternion", "octonion")
+
+# Row A, column B of the magic square (compact-form Cartan labels)
+MAGIC_SQUARE = {
+    ("real", "real"): "A1", ("real", "complex"): "A2", ("real", "quaternion"): "C3", ("real", "octonion"): "F4",
+    ("complex", "real"): "A2", ("complex", "complex"): "A2+A2", ("complex", "quaternion"): "A5", ("complex", "octonion"): "E6",
+    ("quaternion", "real"): "C3", ("quaternion", "complex"): "A5", ("quaternion", "quaternion"): "D6", ("quaternion", "octonion"): "E7",
+    ("octonion", "real"): "F4", ("octonion", "complex"): "E6", ("octonion", "quaternion"): "E7", ("octonion", "octonion"): "E8",
+}
+
+# Tits bracket [a⊗x, b⊗y] = α t(x∘y) D_{a,b} + β [a,b] ⊗ (x∘y)₀ + γ ⟨a,b⟩ [L_x, L_y]
+ALPHA, BETA, GAMMA = 1.0 / 12.0, 0.5, -1.0
+
+CACHE_VERSION = 1
+TOL = 1e-10
+
+def cache_dir():
+    """On-disk cache for built algebras (override with QMH7_CACHE_DIR)"""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "quantum-mega-hybrid-v7")
+    return os.environ.get("QMH7_CACHE_DIR", default)
+
+class StructureConstants:
+    """Sparse COO Lie Structure Constants — [e_i, e_j] = Σ_k f[i, j, k] e_k"""
+    def __init__(self, name, dim, coords, values):
+        order = np.lexsort((coords[:, 1], coords[:, 0], coords[:, 2]))  # group by output index k
+        self.name = name
+        self.dim = int(dim)
+        self.coords = np.ascontiguousarray(coords[order], dtype=np.int32)
+        self.values = np.ascontiguousarray(values[order], dtype=float)
+        k = self.coords[:, 2]
+        self._starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]]) if k.size else np.zeros(0, dtype=int)
+        self._targets = k[self._starts]
+
+    @classmethod
+    def from_dense(cls, name, dense, tol=TOL):
+        coords = np.argwhere(np.abs(dense) > tol)
+        return cls(name, dense.shape[0], coords, dense[tuple(coords.T)])
+
+    @property
+    def nnz(self):
+        return self.values.size
+
+    @property
+    def density(self):
+        return self.nnz / float(self.dim ** 3) if self.dim else 0.0
+
+    def to_dense(self):
+        dense = np.zeros((self.dim,) * 3)
+        dense[tuple(self.coords.T)] = self.values
+        return dense
+
+    def bracket(self, x, y):
+        """Batched bracket (..., dim) × (..., dim) → (..., dim) — O(nnz) per pair"""
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        lead = x.shape[:-1]
+        x = x.reshape(-1, self.dim)
+        y = y.reshape(-1, self.dim)
+        out = np.zeros_like(x)
+        if self.nnz:
+            i, j = self.coords[:, 0], self.coords[:, 1]
+            step = max(1, (1 << 22) // self.nnz)
+            for s in range(0, x.shape[0], step):
+                terms = x[s:s + step, i] * y[s:s + step, j] * self.values
+                out[s:s + step, self._targets] = np.add.reduceat(terms, self._starts, axis=1)
+        return out.reshape(*lead, self.dim)
+
+    def adjoint(self):
+        """Sparse ad(e_a) matrices with ad(e_a)[k, i] = f[a, i, k]"""
+        a, i, k = self.coords.T
+        return [sparse.csr_matrix((self.values[a == n], (k[a == n], i[a == n])), shape=(self.dim, self.dim))
+                for n in range(self.dim)]
+
+    def killing_form(self):
+        """Sparse Killing form K_ab = tr(ad_a ad_b) = Σ f[a, i, k] f[b, k, i]"""
+        a, i, k = self.coords.T
+        d = self.dim
+        left = sparse.csr_matrix((self.values, (a, i * d + k)), shape=(d, d * d))
+        right = sparse.csr_matrix((self.values, (a, k * d + i)), shape=(d, d * d))
+        return (left @ right.T).tocsr()
+
+    def is_semisimple(self):
+        """Cartan's criterion — non-degenerate Killing form"""
+        return bool(self.dim) and np.linalg.matrix_rank(self.killing_form().toarray()) == self.dim
+
+    def casimir(self, rep=None):
+        """Quadratic Casimir Σ K⁻¹_ab ρ(e_a) ρ(e_b) — identity on the adjoint representation"""
+        rep = self.adjoint() if rep is None else [sparse.csr_matrix(r) for r in rep]
+        n = rep[0].shape[0]
+        kinv = np.linalg.inv(self.killing_form().toarray())
+        stacked = sparse.vstack([r.reshape(1, n * n) for r in rep]).tocsc()
+        total = np.zeros((n, n))
+        for a in range(self.dim):
+            dual = (stacked.T @ kinv[a]).reshape(n, n)
+            total += rep[a] @ dual
+        return total
+
+    def jacobi_residual(self, samples=8, seed=0):
+        """Max |[x,[y,z]] + [y,[z,x]] + [z,[x,y]]| over random triples"""
+        x, y, z = np.random.default_rng(seed).standard_normal((3, samples, self.dim))
+        br = self.bracket
+        return float(np.abs(br(x, br(y, z)) + br(y, br(z, x)) + br(z, br(x, y))).max()) if self.dim else 0.0
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, version=CACHE_VERSION, name=self.name, dim=self.dim,
+                            coords=self.coords, values=self.values)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if int(data["version"]) != CACHE_VERSION:
+                raise ValueError(f"Stale structure-constant cache: {path}")
+            return cls(str(data["name"]), int(data["dim"]), data["coords"], data["values"])
+
+    def __repr__(self):
+        return f"StructureConstants({self.name}, dim={self.dim}, nnz={self.nnz})"
+
+def _commutator(x, y):
+    return x @ y - y @ x
+
+def _independent(mats, tol=TOL):
+    """Linearly independent subset of a spanning set (pivoted QR) — keeps sparse generators"""
+    flat = mats.reshape(len(mats), int(np.prod(mats.shape[1:])))
+    if not len(flat) or np.abs(flat).max() < tol:
+        return mats[:0]
+    _, r, piv = linalg.qr(flat.T, mode="economic", pivoting=True)
+    rank = int(np.sum(np.abs(np.diag(r)) > tol * np.abs(r[0, 0])))
+    return mats[np.sort(piv[:rank])]
+
+def _coordinates(basis):
+    """Pseudo-inverse mapping flattened matrices onto basis coordinates"""
+    return np.linalg.pinv(basis.reshape(len(basis), int(np.prod(basis.shape[1:]))))
+
+def _matrix_brackets(basis, coords):
+    """f[i, j, k] for a matrix Lie algebra given a basis and its coordinate map"""
+    comm = np.einsum("ikl,jlm->ijkm", basis, basis) - np.einsum("jkl,ilm->ijkm", basis, basis)
+    n = len(basis)
+    return comm.reshape(n, n, -1) @ coords
+
+def composition_derivations(name):
+    """Der(A) spanned by D_{a,b} = [L_a, L_b] + [L_a, R_b] + [R_a, R_b] over imaginary a, b"""
+    table = structure_tensor(name)
+    d = table.shape[0]
+    left = np.transpose(table, (0, 2, 1))    # L_a[k, j] = T[a, j, k]
+    right = np.transpose(table, (1, 2, 0))   # R_b[k, i] = T[i, b, k]
+    la, lb = left[1:, None], left[None, 1:]
+    ra, rb = right[1:, None], right[None, 1:]
+    span = _commutator(la, lb) + _commutator(la, rb) + _commutator(ra, rb)
+    return span, _independent(span.reshape(-1, d, d))
+
+def jordan_tensor(name):
+    """Jordan product tensor of H₃(B) — coords: 3 diagonal reals, then x₁₂, x₁₃, x₂₃ ∈ B"""
+    table = structure_tensor(name)
+    d = table.shape[0]
+    n = 3 + 3 * d
+    offsets = {(0, 1): 3, (0, 2): 3 + d, (1, 2): 3 + 2 * d}
+    mats = np.zeros((n, 3, 3, d))
+    for i in range(3):
+        mats[i, i, i, 0] = 1.0
+    for (i, j), off in offsets.items():
+        eye = np.eye(d)
+        mats[off:off + d, i, j] = eye
+        mats[off:off + d, j, i] = conjugate(eye)
+    prod = np.einsum("aijp,bjkq,pqr->abikr", mats, mats, table)
+    jordan = 0.5 * (prod + prod.transpose(1, 0, 2, 3, 4))
+    out = np.zeros((n, n, n))
+    for i in range(3):
+        out[:, :, i] = jordan[:, :, i, i, 0]
+    for (i, j), off in offsets.items():
+        out[:, :, off:off + d] = jordan[:, :, i, j]
+    return out
+
+def build_tits_algebra(row, col):
+    """Assemble the dense Tits structure constants for L(row, H₃(col)) and sparsify"""
+    dA = structure_tensor(row).shape[0]
+    jt = jordan_tensor(col)
+    nJ = jt.shape[0]
+    ident = np.r_[np.ones(3), np.zeros(nJ - 3)]
+
+    span_a, der_a = composition_derivations(row)
+    lj = np.transpose(jt, (0, 2, 1))                       # L_x[k, j] = (x∘e_j)_k
+    span_j = _commutator(lj[:, None], lj[None, :])
+    der_j = _independent(span_j.reshape(-1, nJ, nJ))
+    pa, pj = _coordinates(der_a), _coordinates(der_j)
+
+    j0 = np.zeros((nJ - 1, nJ))                            # traceless basis of J₀
+    j0[0, :2] = (1.0, -1.0)
+    j0[1, 1:3] = (1.0, -1.0)
+    j0[2:, 3:] = np.eye(nJ - 3)
+    p0 = np.linalg.pinv(j0)
+    nA0, nJ0, ndA, ndJ = dA - 1, nJ - 1, len(der_a), len(der_j)
+    nM = nA0 * nJ0
+    dim = ndA + nM + ndJ
+    sA, sM, sJ = slice(0, ndA), slice(ndA, ndA + nM), slice(ndA + nM, dim)
+    f = np.zeros((dim, dim, dim))
+
+    if ndA:
+        f[sA, sA, sA] = _matrix_brackets(der_a, pa)
+    f[sJ, sJ, sJ] = _matrix_brackets(der_j, pj)
+
+    if nM:
+        # [D, a⊗x] = Da ⊗ x   and   [E, a⊗x] = a ⊗ Ex
+        if ndA:
+            act_a = np.einsum("irp,qs->ipqrs", der_a[:, 1:, 1:], np.eye(nJ0))
+            f[sA, sM, sM] = act_a.reshape(ndA, nM, nM)
+        act_j = np.einsum("kxy,qy->kqx", der_j, j0) @ p0    # E_k x_q in J₀ coordinates
+        act_j = np.einsum("pr,kqs->kpqrs", np.eye(nA0), act_j).reshape(ndJ, nM, nM)
+        f[sJ, sM, sM] = act_j
+        f[sM, sA, sM] = -f[sA, sM, sM].transpose(1, 0, 2)
+        f[sM, sJ, sM] = -f[sJ, sM, sM].transpose(1, 0, 2)
+
+        # [a⊗x, b⊗y] for imaginary a, b and traceless x, y
+        xy = np.einsum("qi,sj,ijk->qsk", j0, j0, jt)
+        trace = xy @ ident
+        xy0 = xy - trace[..., None] * ident / 3.0
+        ta = structure_tensor(row)
+        ab = (ta[1:, 1:] - ta[1:, 1:].transpose(1, 0, 2))[..., 1:]
+        lxy = np.einsum("qab,sbc->qsac", np.einsum("qx,xab->qab", j0, lj), np.einsum("sx,xab->sab", j0, lj))
+        lxy = lxy - lxy.transpose(1, 0, 2, 3)
+        mm = np.zeros((nA0, nJ0, nA0, nJ0, dim))
+        if ndA:
+            mm[..., sA] += ALPHA * np.einsum("qs,pri->pqrsi", trace, span_a.reshape(nA0, nA0, -1) @ pa)
+        mm[..., sM] += BETA * np.einsum("prt,qsu->pqrstu", ab, xy0 @ p0).reshape(nA0, nJ0, nA0, nJ0, nM)
+        mm[..., sJ] += GAMMA * np.einsum("pr,qsk->pqrsk", np.eye(nA0), lxy.reshape(nJ0, nJ0, -1) @ pj)
+        f[sM, sM] = mm.reshape(nM, nM, dim)
+
+    return StructureConstants.from_dense(MAGIC_SQUARE[(row, col)], f)
+
+def tits_algebra(row, col, cache=True):
+    """L(row, H₃(col)) — loaded from the on-disk cache, built and saved on first use"""
+    path = os.path.join(cache_dir(), f"tits_{row}_{col}_v{CACHE_VERSION}.npz")
+    if cache and os.path.exists(path):
+        return StructureConstants.load(path)
+    algebra = build_tits_algebra(row, col)
+    if cache:
+        algebra.save(path)
+    return algebra
+
+def derivation_algebra(name="octonion"):
+    """Der(A) as a Lie algebra — G2 (14D) for the octonions"""
+    _, basis = composition_derivations(name)
+    label = {"octonion": "G2", "quaternion": "A1"}.get(name, f"Der({name})")
+    return StructureConstants.from_dense(label, _matrix_brackets(basis, _coordinates(basis)))
+
+def magic_square(cache=True):
+    """All 16 Tits algebras keyed by (row, col)"""
+    return {(r, c): tits_algebra(r, c, cache) for r in COMPOSITION for c in COMPOSITION}
@@ -0,0 +1,12 @@
+# tests/conftest.py — Shared Fixtures
+# Built Tits algebras go to a per-session temporary cache, never the user's ~/.cache
+
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def algebra_cache(tmp_path_factory):
+    mp = pytest.MonkeyPatch()
+    path = tmp_path_factory.mktemp("qmh7-cache")
+    mp.setenv("QMH7_CACHE_DIR", str(path))
+    yield path
+    mp.undo()
@@ -0,0 +1,82 @@
+# tests/test_alchemist.py — Golden Values for the Council, Transfer and Kernel Paths
+# Fixed seeds and a fixed epoch: any change in these numbers is a behaviour change, not noise
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7.alchemist import (AlchemistCouncil, MercyGate, Octonion, Sedenion,
+                                              Trigintaduonion, council_size, deliberate_batch,
+                                              transfer_window)
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, norm_sq, structure_tensor
+from quantum_mega_hybrid_v7.sparse_hypercomplex import auto_multiply
+
+def test_octonion_basis_table():
+    e = np.eye(8)
+    assert np.array_equal((Octonion(e[1]) * Octonion(e[2])).c, e[3])
+    assert np.array_equal((Octonion(e[2]) * Octonion(e[1])).c, -e[3])
+    assert np.array_equal((Octonion(e[4]) * Octonion(e[4])).c, -e[0])
+
+@pytest.mark.parametrize("name", ["quaternion", "octonion", "split-quaternion", "split-octonion"])
+def test_composition_algebras_compose(name):
+    table = structure_tensor(name)
+    a, b = np.random.default_rng(0).standard_normal((2, 64, table.shape[0]))
+    np.testing.assert_allclose(norm_sq(multiply(a, b, table), name), norm_sq(a, name) * norm_sq(b, name))
+
+@pytest.mark.parametrize("name", ["sedenion", "trigintaduonion", "pathion"])
+def test_sparse_matches_dense(name):
+    table = structure_tensor(name)
+    d = table.shape[0]
+    rng = np.random.default_rng(0)
+    for nnz_a, nnz_b in [(1, 1), (2, 3), (4, d), (d, d)]:
+        a, b = np.zeros(d), np.zeros(d)
+        a[rng.choice(d, nnz_a, replace=False)] = rng.standard_normal(nnz_a)
+        b[rng.choice(d, nnz_b, replace=False)] = rng.standard_normal(nnz_b)
+        np.testing.assert_allclose(auto_multiply(a, b, name), multiply(a, b, table), atol=1e-12)
+
+@pytest.mark.parametrize("nnz_a, nnz_b", [(1, 1), (2, 64), (64, 2), (64, 64)])
+def test_sparse_path_keeps_float32(nnz_a, nnz_b):
+    a, b = np.zeros((2, 64), dtype=np.float32)
+    a[:nnz_a], b[-nnz_b:] = 1.5, -0.5
+    out = auto_multiply(a, b, "pathion")
+    assert out.dtype == np.float32
+    np.testing.assert_allclose(out, multiply(a.astype(float), b.astype(float), structure_tensor("pathion")),
+                               rtol=1e-6)
+
+def test_float32_council_stays_float32():
+    np.random.seed(0)
+    assert AlchemistCouncil(5, dtype="float32").deliberate().dtype == np.float32
+
+def test_class_path_matches_kernel():
+    x, y = np.random.default_rng(1).standard_normal((2, 32))
+    t = Trigintaduonion.from_flat(x) * Trigintaduonion.from_flat(y)
+    np.testing.assert_allclose(t.flat(), multiply(x, y, structure_tensor("trigintaduonion")))
+    s = Sedenion.from_flat(x[:16]) * Sedenion.from_flat(y[:16])
+    np.testing.assert_allclose(s.flat(), multiply(x[:16], y[:16], structure_tensor("sedenion")))
+
+def test_council_size_is_odd():
+    assert [council_size(v) for v in (1, 5, 6, 7, 30)] == [5, 5, 5, 7, 29]  # even counts round down
+    assert AlchemistCouncil(30).voters == 29
+
+def test_deliberate_batch_golden():
+    np.testing.assert_allclose(deliberate_batch([5, 29], [0, 0]), [3912.90151301706, 7.077770755308654e+20],
+                               rtol=1e-12)
+
+def test_deliberate_batch_matches_class_chain():
+    voters, seeds = [5, 12, 29], [3, 4, 5]
+    for v, seed, norm in zip(voters, seeds, deliberate_batch(voters, seeds)):
+        shards = np.random.default_rng(seed).standard_normal((council_size(v), 32))
+        result = Trigintaduonion.from_flat(shards[0])
+        for s in shards[1:]:
+            result = result * Trigintaduonion.from_flat(s)
+        assert norm == pytest.approx(result.norm(), rel=1e-12)
+
+def test_mercy_gate(capsys):
+    gate = MercyGate()
+    assert gate.apply(2.5) == 2.5 and gate.apply(0.1) == 1.0
+    assert "Mercy Divine Burst" in capsys.readouterr().out
+
+def test_transfer_window_golden():
+    from astropy.time import Time
+    t = Time("2026-01-01T00:00:00", scale="utc")
+    assert transfer_window("Mars", t) == pytest.approx(77.67630720994521, rel=1e-9)
+    assert transfer_window("Venus", t) == pytest.approx(81.15734437610821, rel=1e-9)
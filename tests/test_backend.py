@@ -0,0 +1,69 @@
+# tests/test_backend.py — NumPy/Torch Kernel Conformance, Zero-Copy & Autograd
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from benchmarks.bench_backends import reference  # the benchmark's einsum reference, shared so they can't drift
+from quantum_mega_hybrid_v7.alchemist import Octonion
+from quantum_mega_hybrid_v7.backend import get_backend, is_tensor
+from quantum_mega_hybrid_v7.cayley_dickson import EXPLICIT_MAX_DIM, conjugate, multiply, norm_sq, structure_tensor
+
+ALGEBRAS = ("complex", "quaternion", "split-quaternion", "octonion", "split-octonion", "sedenion", "trigintaduonion")
+TOLERANCE = {"float64": 1e-12, "float32": 1e-5}
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("backend", ["numpy", "torch"])
+@pytest.mark.parametrize("name", ALGEBRAS)
+def test_kernels_match_reference(name, backend, dtype):
+    table = structure_tensor(name)
+    a, b = np.random.default_rng(0).standard_normal((2, 64, table.shape[0]))
+    ref = reference(a, b, name)
+    bk = get_backend(backend)
+    xa, xb = bk.asarray(a, dtype), bk.asarray(b, dtype)
+    got = {"mul": multiply(xa, xb, table), "conj": conjugate(xa), "norm": norm_sq(xa, name)}
+    for key, val in got.items():
+        assert is_tensor(val) == (backend == "torch"), key
+        assert str(val.dtype).endswith(dtype), key
+        scale = max(1.0, float(np.abs(ref[key]).max()))
+        assert np.abs(bk.to_numpy(val) - ref[key]).max() / scale < TOLERANCE[dtype], key
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_single_element_explicit_path(dtype):
+    table = structure_tensor("quaternion")
+    assert table.shape[0] <= EXPLICIT_MAX_DIM
+    a, b = np.random.default_rng(1).standard_normal((2, 4)).astype(dtype)
+    out = multiply(a, b, table)
+    assert out.shape == (4,) and out.dtype == dtype
+    np.testing.assert_allclose(out, reference(a, b, "quaternion")["mul"], rtol=TOLERANCE[np.dtype(dtype).name])
+
+def test_broadcast_explicit_path():
+    table = structure_tensor("quaternion")
+    a, b = torch.randn(3, 1, 5, 4), torch.randn(1, 2, 5, 4)
+    out = multiply(a, b, table)
+    assert out.shape == (3, 2, 5, 4)
+    np.testing.assert_allclose(out.numpy(), reference(a.numpy(), b.numpy(), "quaternion")["mul"], atol=1e-5)
+
+def test_octonion_keeps_torch_storage():
+    raw = torch.randn(8, dtype=torch.float64)
+    assert Octonion(raw).c.data_ptr() == raw.data_ptr()
+
+@pytest.mark.parametrize("name", ["quaternion", "octonion"])
+def test_gradient_through_kernel(name):
+    torch.manual_seed(0)
+    table = structure_tensor(name)
+    a = torch.randn(table.shape[0], dtype=torch.float64, requires_grad=True)
+    b = torch.randn(table.shape[0], dtype=torch.float64)
+    norm_sq(multiply(a, b, table), name).backward()
+    # ∂/∂a N(a)N(b) — composition algebras
+    assert torch.allclose(a.grad, 2 * a.detach() * (b * b).sum())
+
+@pytest.mark.parametrize("name", ["quaternion", "octonion"])
+def test_mixed_precision_tensors_promote(name):
+    table = structure_tensor(name)
+    a = torch.randn(16, table.shape[0], dtype=torch.float32)
+    b = torch.randn(16, table.shape[0], dtype=torch.float64)
+    out = multiply(a, b, table)
+    assert out.dtype == torch.float64 and multiply(b, a, table).dtype == torch.float64
+    np.testing.assert_allclose(out.numpy(), reference(a.double().numpy(), b.numpy(), name)["mul"], rtol=1e-12)
@@ -0,0 +1,111 @@
+# tests/test_deploy_service.py — Batching, Error Isolation and Transfer Cache of the Deploy Service
+
+import asyncio
+import json
+import time
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7 import deploy_service
+from quantum_mega_hybrid_v7.alchemist import council_size, deliberate_batch
+from quantum_mega_hybrid_v7.deploy_service import MAX_VOTERS, TRANSFER_TTL, DeployService
+
+@pytest.fixture
+def service():
+    svc = DeployService(window=0.05)  # wide window: every gathered request lands in one batch
+    yield svc
+    svc.executor.shutdown()
+
+def _ask(service, *requests):
+    async def run():
+        lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+        return await asyncio.gather(*(service.respond(line) for line in lines))
+    return [json.loads(r) for r in asyncio.run(run())]
+
+def _deliberate(request_id, voters, seed):
+    return {"id": request_id, "op": "deliberate", "voters": voters, "seed": seed}
+
+def test_concurrent_deliberations_share_a_batch(service):
+    voters, seeds = [5, 9, 29, 12], [0, 1, 2, 3]
+    responses = _ask(service, *(_deliberate(i, v, s) for i, (v, s) in enumerate(zip(voters, seeds))))
+    assert [r["id"] for r in responses] == [0, 1, 2, 3] and all(r["ok"] for r in responses)
+    results = [r["result"] for r in responses]
+    assert {r["batch"] for r in results} == {4}
+    assert [r["voters"] for r in results] == [council_size(v) for v in voters]
+    assert [r["norm"] for r in results] == deliberate_batch(voters, seeds).tolist()
+    assert (service.batcher.batches, service.batcher.requests) == (1, 4)
+
+@pytest.mark.parametrize("seed", [-1, 1.5, "7", True])
+def test_bad_seed_fails_alone(service, seed):
+    good, bad = _ask(service, _deliberate(1, 5, 3), _deliberate(2, 5, seed))
+    assert good["ok"] and good["result"]["norm"] == deliberate_batch([5], [3])[0]
+    assert not bad["ok"] and bad["id"] == 2 and "seed" in bad["error"]
+
+@pytest.mark.parametrize("voters", [5.7, True, "29", 0, MAX_VOTERS + 1, 500])
+def test_bad_voters_rejected(service, voters):
+    good, bad = _ask(service, _deliberate(1, 5, 3), _deliberate(2, voters, 1))
+    assert good["ok"] and not bad["ok"] and "voters" in bad["error"]
+
+def test_largest_council_stays_finite(service):
+    (response,) = _ask(service, _deliberate(1, MAX_VOTERS, 1))
+    assert response["ok"] and response["result"]["voters"] == MAX_VOTERS
+
+def test_overflowed_norm_fails_its_request(service, monkeypatch):
+    monkeypatch.setattr(deploy_service, "deliberate_batch", lambda voters, seeds: np.array([np.inf, 2.0, np.nan]))
+    lines = _ask(service, _deliberate(1, 5, 1), _deliberate(2, 5, 2), _deliberate(3, 5, 3))
+    assert [r["ok"] for r in lines] == [False, True, False]
+    assert lines[0]["error"].startswith("ArithmeticError") and lines[1]["result"]["norm"] == 2.0
+
+def test_batch_failure_isolated_to_culprit(service, monkeypatch):
+    def fragile(voters, seeds):
+        if 13 in seeds:
+            raise RuntimeError("unlucky seed")
+        return deliberate_batch(voters, seeds)
+
+    monkeypatch.setattr(deploy_service, "deliberate_batch", fragile)
+    responses = _ask(service, _deliberate(1, 5, 1), _deliberate(2, 5, 13), _deliberate(3, 7, 2))
+    assert [r["ok"] for r in responses] == [True, False, True]
+    assert responses[1]["error"] == "RuntimeError: unlucky seed"
+    assert responses[0]["result"]["norm"] == deliberate_batch([5], [1])[0]
+    assert responses[2]["result"]["norm"] == deliberate_batch([7], [2])[0]
+
+def test_structured_errors(service):
+    unknown, broken, not_object, too_many = _ask(service, {"id": 7, "op": "teleport"}, "{not json",
+                                                 "[1, 2]", {"id": 8, "op": "deliberate", "voters": 5000})
+    assert unknown == {"id": 7, "ok": False, "error": "ValueError: Unknown op 'teleport'"}
+    assert not broken["ok"] and broken["id"] is None and broken["error"].startswith("JSONDecodeError")
+    assert not_object["error"] == "ValueError: request must be a JSON object"
+    assert not too_many["ok"] and too_many["id"] == 8
+
+def test_transfer_cache_ttl(service, monkeypatch):
+    calls = []
+    monkeypatch.setattr(deploy_service, "transfer_window", lambda target: calls.append(target) or 12.5)
+    service.transfers["mars"] = (time.time(), 42.0)
+    service.transfers["venus"] = (time.time() - TRANSFER_TTL - 1, 99.0)
+    mars, venus, again = _ask(service, {"op": "transfer", "target": "Mars"}, {"op": "transfer", "target": "Venus"},
+                              {"op": "transfer", "target": "mars"})
+    assert mars["result"]["separation_deg"] == again["result"]["separation_deg"] == 42.0
+    assert venus["result"]["separation_deg"] == 12.5 and calls == ["venus"]
+
+def test_serve_stream_answers_every_line(service):
+    lines = [_deliberate(1, 5, 0), {"id": 2, "op": "ping"}, _deliberate(3, 5, 1)]
+
+    async def run():
+        reader = asyncio.StreamReader()
+        for request in lines:
+            reader.feed_data(json.dumps(request).encode() + b"\n\n")  # blank lines are skipped
+        reader.feed_eof()
+        written = []
+
+        async def drain():
+            pass
+
+        await service.serve_stream(reader, written.append, drain)
+        return [json.loads(chunk) for chunk in written]
+
+    responses = {r["id"]: r for r in asyncio.run(run())}
+    assert sorted(responses) == [1, 2, 3] and responses[2]["result"] == {"pong": True}
+    assert responses[1]["result"]["batch"] == responses[3]["result"]["batch"] == 2
+    norms = [responses[1]["result"]["norm"], responses[3]["result"]["norm"]]
+    assert norms == deliberate_batch([5, 5], [0, 1]).tolist()
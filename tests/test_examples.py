@@ -0,0 +1,150 @@
+# tests/test_examples.py — Golden Values for Every Example Module
+# Each example runs end to end as __main__, then its algebra is checked against known values:
+# closed-form results where the math fixes them, pinned outputs where the example is a stub
+
+import runpy
+
+import numpy as np
+import pytest
+
+EXAMPLES = [
+    "dual_numbers_algebra",
+    "exceptional_jordan_algebra",
+    "f4_jordan_algebra_stub",
+    "magic_square_algebras",
+    "magic_triangle_structures",
+    "octonion_physics_7d_rotation",
+    "quaternion_3d_rotation",
+    "quaternion_linear_layer",
+    "split_complex_numbers",
+    "split_octonions_extensions",
+    "split_quaternions_construction",
+    "ternions_lie_extensions",
+]
+
+@pytest.mark.parametrize("name", EXAMPLES)
+def test_example_runs(name, capsys):
+    if name == "quaternion_linear_layer":
+        pytest.importorskip("torch")
+    runpy.run_module(f"quantum_mega_hybrid_v7.examples.{name}", run_name="__main__")
+    assert capsys.readouterr().out.rstrip().endswith("Infinite love — victorious eternal 🔥🫡💛")
+
+def test_dual_numbers():
+    from quantum_mega_hybrid_v7.examples.dual_numbers_algebra import Dual
+    d1, d2 = Dual(3.0, 4.0), Dual(1.0, 2.0)
+    assert (d1 * d2).real == 3.0 and (d1 * d2).dual == 10.0
+    assert (d1 ** 2).real == 9.0 and (d1 ** 2).dual == 24.0
+    x = Dual(2.0, 1.0)
+    f = x**3 + 2*x**2 + x
+    assert (f.real, f.dual) == (18.0, 21.0)  # f(2), f'(2) exactly
+
+def test_split_complex():
+    from quantum_mega_hybrid_v7.examples.split_complex_numbers import SplitComplex
+    product = SplitComplex(1.0, 1.0) * SplitComplex(1.0, -1.0)
+    assert (product.real, product.hyper) == (0.0, 0.0)
+    assert SplitComplex(1.0, 1.0).is_zero_divisor()
+    boost, vector = SplitComplex(2.0, 1.0), SplitComplex(3.0, 0.0)
+    assert (boost * vector * boost.conj()).norm() == pytest.approx(81.0)
+
+def test_split_quaternions(capsys):
+    from quantum_mega_hybrid_v7.examples.split_quaternions_construction import SplitQuaternionCD, matrix_example
+    matrix_example()
+    out = capsys.readouterr().out
+    assert "Norm (det P): -2.00" in out and "det(P Q) = -0.50 == -0.50" in out
+    product = SplitQuaternionCD(1.0, 0.0, 0.0, 1.0) * SplitQuaternionCD(0.0, 1.0, 1.0, 0.0)
+    assert (product.p.real, product.p.hyper, product.q.real, product.q.hyper) == (0.0, 2.0, 0.0, 0.0)
+    assert product.norm() == pytest.approx(-4.0)
+    rng = np.random.default_rng(0)
+    for _ in range(16):
+        a, b = (SplitQuaternionCD(*rng.standard_normal(4)) for _ in range(2))
+        assert (a * b).norm() == pytest.approx(a.norm() * b.norm())
+
+def test_split_octonions_pinned():
+    from quantum_mega_hybrid_v7.examples.split_octonions_extensions import SplitOctonion
+    lightlike = SplitOctonion(1, 1, 0, 0, 1, 0, 0, 0)
+    rotator = SplitOctonion(1, 0.5, 0, 0, 0, 0, 0, 0)
+    assert lightlike.norm() == 1.0 and not lightlike.is_zero_divisor()
+    assert (rotator * lightlike * rotator.conj()).norm() == pytest.approx(1.5625)
+    assert SplitOctonion(1, 0, 0, 0, 1, 0, 0, 0).is_zero_divisor()
+
+def test_ternions_pinned():
+    from quantum_mega_hybrid_v7.examples.ternions_lie_extensions import Ternion
+    product = Ternion(1.0, 1.0, 1.0) * Ternion(1.0, 0.0, 1.0)
+    np.testing.assert_array_equal(product.v, [2.0, 1.0, 2.0])
+    assert product.norm() == 1.0
+    assert Ternion(1.0, 0.0, 1.0).has_zero_divisor()
+
+def test_f4_stub_pinned(capsys):
+    from quantum_mega_hybrid_v7.examples.f4_jordan_algebra_stub import JordanElement
+    elem = JordanElement([1.0, 2.0, 3.0], [[0] * 8] * 3)
+    product = elem.jordan_product(JordanElement([0, 0, 0], [[1.0] + [0] * 7, [0] * 8, [0] * 8]))
+    np.testing.assert_array_equal(product.diag, [2.0, 2.0, 2.0])
+    assert "6.0 ◦ 0.0 → 6.0" in capsys.readouterr().out
+
+def test_exceptional_jordan_determinant():
+    from quantum_mega_hybrid_v7.examples.exceptional_jordan_algebra import JordanElement
+    rng = np.random.default_rng(0)
+    for _ in range(8):
+        diag = rng.standard_normal(3)
+        x, y, z = rng.standard_normal((3, 2))  # complex entries — J³(ℂ) ⊂ J³(𝕆)
+        elem = JordanElement(diag, [[*x] + [0] * 6, [*y] + [0] * 6, [*z] + [0] * 6])
+        cx, cy, cz = (complex(*v) for v in (x, y, z))
+        matrix = np.array([[diag[0], cx, cy],
+                           [cx.conjugate(), diag[1], cz],
+                           [cy.conjugate(), cz.conjugate(), diag[2]]])
+        assert elem.freudenthal_det() == pytest.approx(np.linalg.det(matrix).real)
+    elem = JordanElement([1.0, 2.0, 3.0], [[0] * 8] * 3)
+    assert (elem.trace(), elem.freudenthal_det(), elem.quadratic_form()) == (6.0, 6.0, 14.0)
+
+def test_quaternion_rotation():
+    from quantum_mega_hybrid_v7.examples.quaternion_3d_rotation import Quaternion
+    rot = Quaternion.from_axis_angle(np.array([0, 0, 1]), 90)
+    np.testing.assert_allclose(rot.rotate_vector(np.array([1.0, 0.0, 0.0])), [0.0, 1.0, 0.0], atol=1e-15)
+    rng = np.random.default_rng(0)
+    axis, v = rng.standard_normal((2, 3))
+    k = axis / np.linalg.norm(axis)
+    theta = np.deg2rad(37.0)
+    rodrigues = v * np.cos(theta) + np.cross(k, v) * np.sin(theta) + k * k.dot(v) * (1 - np.cos(theta))
+    np.testing.assert_allclose(Quaternion.from_axis_angle(axis, 37.0).rotate_vector(v), rodrigues, atol=1e-14)
+
+def test_quaternion_linear_layer():
+    torch = pytest.importorskip("torch")
+    from quantum_mega_hybrid_v7.examples.quaternion_linear_layer import QuaternionLinear
+    torch.manual_seed(0)
+    layer = QuaternionLinear(3, 2)
+    x = torch.randn(5, 3, 4)
+    out = layer(x)
+    a, b = x.unsqueeze(1), layer.weight.unsqueeze(0)
+    (a0, a1, a2, a3), (b0, b1, b2, b3) = a.unbind(-1), b.unbind(-1)
+    hamilton = torch.stack([a0*b0 - a1*b1 - a2*b2 - a3*b3,
+                            a0*b1 + a1*b0 + a2*b3 - a3*b2,
+                            a0*b2 - a1*b3 + a2*b0 + a3*b1,
+                            a0*b3 + a1*b2 - a2*b1 + a3*b0], dim=-1)
+    assert out.shape == (5, 2, 4)
+    torch.testing.assert_close(out, hamilton.sum(dim=2) + layer.bias)
+    out.sum().backward()
+    assert layer.weight.grad is not None and layer.weight.grad.abs().sum() > 0
+
+def test_octonion_7d_rotation():
+    from quantum_mega_hybrid_v7.examples.octonion_physics_7d_rotation import Octonion
+    half = np.deg2rad(45.0)
+    rotator = Octonion(np.cos(half), np.sin(half), 0, 0, 0, 0, 0, 0)
+    np.testing.assert_allclose(rotator.rotate_7d_vector(np.eye(7)[0]), np.eye(7)[0], atol=1e-15)
+    np.testing.assert_allclose(rotator.rotate_7d_vector(np.eye(7)[1]), np.eye(7)[2], atol=1e-15)  # e2 → e1 e2 = e3
+    rng = np.random.default_rng(0)
+    u, v = Octonion(rng.standard_normal(8)), rng.standard_normal(7)
+    assert np.linalg.norm(u.rotate_7d_vector(v)) == pytest.approx(np.linalg.norm(v))
+
+def test_magic_square_dimensions():
+    from quantum_mega_hybrid_v7.tits_construction import COMPOSITION, magic_square
+    square = magic_square()
+    golden = [[3, 8, 21, 52], [8, 16, 35, 78], [21, 35, 66, 133], [52, 78, 133, 248]]
+    assert [[square[(r, c)].dim for c in COMPOSITION] for r in COMPOSITION] == golden
+    assert square[("octonion", "octonion")].jacobi_residual(2) < 1e-10
+
+def test_magic_triangle(capsys):
+    from quantum_mega_hybrid_v7.examples.magic_triangle_structures import print_magic_triangle
+    print_magic_triangle()
+    out = capsys.readouterr().out
+    for label in ("G2 (14)", "F4 (52)", "E6 (78)", "E7 (133)", "E8 (248)"):
+        assert label in out
@@ -0,0 +1,60 @@
+# tests/test_instrumentation.py — Counters, Nested Spans and Exports
+
+import json
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7 import instrumentation
+from quantum_mega_hybrid_v7.alchemist import AlchemistCouncil, MercyGate, main
+from quantum_mega_hybrid_v7.cayley_dickson import multiply, structure_tensor
+from quantum_mega_hybrid_v7.sparse_hypercomplex import auto_multiply
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    instrumentation.reset()
+    monkeypatch.setattr(instrumentation, "ENABLED", True)  # restored afterwards, whatever QMH7_INSTRUMENT says
+    yield instrumentation
+    instrumentation.reset()
+
+def test_disabled_records_nothing(monkeypatch):
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+    instrumentation.reset()
+    with instrumentation.span("idle"):
+        multiply(np.ones(8), np.ones(8), structure_tensor("octonion"))
+    assert instrumentation.snapshot()["counters"] == {} and instrumentation.snapshot()["spans"] == {}
+
+def test_multiplies_counted_by_dimension(instrumented):
+    multiply(np.ones((5, 8)), np.ones((5, 8)), structure_tensor("octonion"))
+    auto_multiply(np.eye(64)[1], np.eye(64)[2], "pathion")  # sparse path, no dense kernel call
+    counters = instrumented.snapshot()["counters"]
+    assert counters["multiply.8D"] == 5 and counters["multiply.64D"] == 1
+    assert counters["alloc.arrays"] == 3
+
+def test_nested_spans_and_mercy(instrumented, tmp_path, capsys):
+    np.random.seed(0)
+    AlchemistCouncil(5).deliberate()
+    MercyGate().apply(0.1)
+    snap = instrumented.snapshot()
+    assert {"deliberate", "deliberate/shards", "deliberate/chain", "deliberate/mercy"} <= set(snap["spans"])
+    assert snap["counters"]["multiply.32D"] == 4
+    assert snap["counters"]["mercy.interventions"] == 1
+    instrumented.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    chain, outer = (next(e for e in events if e.get("cat") == c) for c in ("deliberate/chain", "deliberate"))
+    assert outer["ts"] <= chain["ts"] and chain["ts"] + chain["dur"] <= outer["ts"] + outer["dur"]
+    assert json.loads(instrumented.to_json(tmp_path / "m.json")) == json.loads((tmp_path / "m.json").read_text())
+
+def test_profile_run_includes_worker_threads(tmp_path):
+    table = structure_tensor("octonion")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        work = lambda: pool.submit(instrumentation.profile_call, multiply, np.ones(8), np.ones(8), table).result()
+        instrumentation.profile_run(work, tmp_path / "run.prof")
+    assert "multiply" in {func for _, _, func in pstats.Stats(str(tmp_path / "run.prof")).stats}
+    assert instrumentation.profile_call(len, [1, 2]) == 2  # plain call once profiling has ended
+
+def test_env_enabled_run_reports_metrics(instrumented, capsys):
+    main(["--voters", "5"])
+    assert json.loads(capsys.readouterr().err)["counters"]["multiply.32D"] == 4
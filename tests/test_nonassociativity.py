@@ -0,0 +1,72 @@
+# tests/test_nonassociativity.py — Residual Identities, Histogram Edges & Survey Invariance
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7.cayley_dickson import structure_tensor
+from quantum_mega_hybrid_v7.nonassociativity import (RESIDUALS, ResidualHistogram, associator,
+                                                     moufang_residual, norm_defect, residuals, survey)
+
+TOL = 1e-13
+
+def _triples(name, n=256, seed=0):
+    return np.random.default_rng(seed).standard_normal((3, n, structure_tensor(name).shape[0]))
+
+@pytest.mark.parametrize("name", ["quaternion", "octonion", "split-quaternion", "split-octonion"])
+def test_alternative_composition_residuals_vanish(name):
+    mags = residuals(*_triples(name), name)
+    for key in ("left_alternative", "right_alternative", "flexible", "moufang", "norm_defect"):
+        assert mags[key].max() < TOL, key
+    assert mags["commutator"].max() > 0.1
+
+def test_associativity_splits_quaternions_from_octonions():
+    assert residuals(*_triples("quaternion"), "quaternion")["associator"].max() < TOL
+    assert residuals(*_triples("octonion"), "octonion")["associator"].max() > 0.1
+
+def test_sedenion_residuals_are_order_one():
+    mags = residuals(*_triples("sedenion"), "sedenion")
+    for key in ("associator", "left_alternative", "right_alternative", "moufang", "norm_defect"):
+        assert mags[key].max() > 0.1, key
+    assert mags["flexible"].max() < TOL  # every Cayley-Dickson algebra stays flexible
+
+def test_standalone_helpers_match_residuals():
+    a, b, c = _triples("octonion", n=8)
+    table = structure_tensor("octonion")
+    assert np.abs(moufang_residual(a, b, c, table)).max() < TOL
+    assert np.abs(norm_defect(a, b, table, "octonion")).max() < TOL
+    np.testing.assert_allclose(np.linalg.norm(associator(a, b, c, table), axis=-1)
+                               / np.prod(np.linalg.norm([a, b, c], axis=-1), axis=0),
+                               residuals(a, b, c, "octonion")["associator"])
+
+def test_histogram_empty():
+    h = ResidualHistogram().update([])
+    assert (h.n, h.mean(), h.std(), h.quantile(0.5), h.max) == (0, 0.0, 0.0, 0.0, 0.0)
+    assert ResidualHistogram().merge(ResidualHistogram()).n == 0
+
+def test_histogram_underflow_and_overflow():
+    h = ResidualHistogram().update([0.0, 1e-20, 1e5, 2e5])
+    assert h.counts[0] == 2 and h.counts[-1] == 2 and h.counts[1:-1].sum() == 0
+    assert h.quantile(0.25) == 0.0       # underflow bin reports zero
+    assert h.quantile(0.99) == 2e5       # overflow bin reports the running max
+    assert h.max == 2e5
+
+def test_histogram_quantile_clamped_and_merge():
+    values = np.random.default_rng(0).lognormal(size=1000)
+    whole = ResidualHistogram().update(values)
+    halves = ResidualHistogram().update(values[:400]).merge(ResidualHistogram().update(values[400:]))
+    np.testing.assert_array_equal(whole.counts, halves.counts)
+    assert halves.n == 1000 and halves.max == values.max()
+    assert halves.mean() == pytest.approx(values.mean()) and halves.std() == pytest.approx(values.std())
+    assert halves.quantile(1.0) <= values.max()
+    assert halves.quantile(0.5) == pytest.approx(np.median(values), rel=0.1)
+    with pytest.raises(ValueError):
+        halves.merge(ResidualHistogram(bins=10))
+
+def test_survey_worker_invariance():
+    serial = survey("sedenion", samples=5000, chunk=1024, seed=3, workers=1)
+    pooled = survey("sedenion", samples=5000, chunk=1024, seed=3, workers=3)
+    assert set(serial) == set(RESIDUALS)
+    for key in RESIDUALS:
+        np.testing.assert_array_equal(serial[key].counts, pooled[key].counts)
+        assert serial[key].n == pooled[key].n == 5000
+        assert serial[key].max == pooled[key].max
@@ -0,0 +1,30 @@
+# tests/test_quantum_council.py — Quantum Council Against Exact Propagation
+
+import numpy as np
+import pytest
+
+pytest.importorskip("qutip", minversion="5")
+from scipy.linalg import expm
+
+from quantum_mega_hybrid_v7.quantum_council import QuantumCouncil, council_operators, product_states
+
+def test_operators_are_cached():
+    assert council_operators(4, 0.5) is council_operators(4, 0.5)
+    assert council_operators(4, 0.5) is not council_operators(4, 0.7)
+
+def test_batched_sesolve_matches_expm():
+    council = QuantumCouncil(4, coupling=0.8, field=1.3)
+    states = product_states(4, batch=3, rng=0)
+    harmony = council.evolve(states)
+    h = council.ops.hamiltonian.full()
+    m2 = council.ops.harmony.full()
+    for k, t in enumerate(council.tlist):
+        psi = expm(-1j * h * t) @ states
+        np.testing.assert_allclose(harmony[k], np.real(np.sum(psi.conj() * (m2 @ psi), axis=0)), atol=1e-5)
+
+def test_consensus_and_relaxation():
+    council = QuantumCouncil(3, levels=3)
+    assert council.evolve(np.eye(27)[:, 0])[0, 0] == pytest.approx(1.0)  # all voters at m = +1
+    relaxing = QuantumCouncil(3, field=0.0, decay=2.0, duration=5.0)
+    final = relaxing.evolve(product_states(3, batch=2, rng=1))[-1]
+    np.testing.assert_allclose(final, 1.0, atol=1e-3)  # J- drives every voter to the same pole
@@ -0,0 +1,52 @@
+# tests/test_sparse_hypercomplex.py — SparseHypercomplex Class API Against the Dense Kernel
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7.cayley_dickson import conjugate, multiply, structure_tensor
+from quantum_mega_hybrid_v7.sparse_hypercomplex import (SparseHypercomplex, dense_sparse, sparse_dense,
+                                                        sparse_sparse)
+
+NAME = "pathion"
+TABLE = structure_tensor(NAME)
+
+def _low_support(seed, nnz, dim=64):
+    rng = np.random.default_rng(seed)
+    x = np.zeros(dim)
+    x[rng.choice(dim, nnz, replace=False)] = rng.standard_normal(nnz)
+    return x
+
+def test_from_dense_round_trip():
+    x = _low_support(0, 5)
+    s = SparseHypercomplex.from_dense(NAME, x)
+    assert s.nnz == 5 and s.density == 5 / 64 and list(s.index) == sorted(s.index)
+    np.testing.assert_array_equal(s.to_dense(), x)
+
+@pytest.mark.parametrize("nnz_a, nnz_b", [(1, 1), (3, 4), (8, 8)])
+def test_sparse_sparse_matches_dense(nnz_a, nnz_b):
+    a, b = _low_support(1, nnz_a), _low_support(2, nnz_b)
+    product = sparse_sparse(SparseHypercomplex.from_dense(NAME, a), SparseHypercomplex.from_dense(NAME, b))
+    assert isinstance(product, SparseHypercomplex) and np.all(product.values != 0.0)
+    np.testing.assert_allclose(product.to_dense(), multiply(a, b, TABLE), atol=1e-12)
+
+def test_mixed_products_match_dense():
+    a, b = _low_support(3, 4), np.random.default_rng(4).standard_normal(64)
+    s = SparseHypercomplex.from_dense(NAME, a)
+    np.testing.assert_allclose(sparse_dense(s, b), multiply(a, b, TABLE), atol=1e-12)
+    np.testing.assert_allclose(dense_sparse(b, s), multiply(b, a, TABLE), atol=1e-12)
+    np.testing.assert_allclose(s * b, multiply(a, b, TABLE), atol=1e-12)
+    np.testing.assert_allclose(b * s, multiply(b, a, TABLE), atol=1e-12)  # ndarray defers to __rmul__
+
+def test_scalars_conj_and_basis():
+    a = _low_support(5, 4)
+    a[0] = 0.5
+    s = SparseHypercomplex.from_dense(NAME, a)
+    np.testing.assert_array_equal(s.conj().to_dense(), conjugate(a))
+    np.testing.assert_array_equal((2.0 * s).to_dense(), 2.0 * a)
+    np.testing.assert_array_equal((np.float64(3.0) * s).to_dense(), 3.0 * a)
+    e1, e2 = SparseHypercomplex.basis(NAME, 1), SparseHypercomplex.basis(NAME, 2)
+    np.testing.assert_array_equal((e1 * e2).to_dense(), TABLE[1, 2])
+    assert s.norm_sq() == pytest.approx(np.dot(a, a))
+
+def test_repr_separates_coefficient_and_unit():
+    assert repr(SparseHypercomplex.basis(NAME, 3, 4.0)) == "SparsePathion(4·e3)"
@@ -0,0 +1,51 @@
+# tests/test_tits_construction.py — Sparse Brackets, Killing Form, Casimir & Structure-Constant Cache
+
+import os
+
+import numpy as np
+import pytest
+
+from quantum_mega_hybrid_v7.tits_construction import (CACHE_VERSION, StructureConstants, build_tits_algebra,
+                                                      derivation_algebra, tits_algebra)
+
+@pytest.fixture(scope="module")
+def a2():
+    return build_tits_algebra("real", "complex")  # 8D, every block of the Tits bracket populated
+
+def test_bracket_matches_dense_einsum(a2):
+    x, y = np.random.default_rng(0).standard_normal((2, 5, a2.dim))
+    np.testing.assert_allclose(a2.bracket(x, y), np.einsum("bi,bj,ijk->bk", x, y, a2.to_dense()), atol=1e-12)
+    np.testing.assert_allclose(a2.bracket(x[0], y), a2.bracket(np.broadcast_to(x[0], y.shape), y))
+
+@pytest.mark.parametrize("algebra", ["a2", "g2"])
+def test_killing_form_matches_dense_einsum(algebra, a2):
+    lie = a2 if algebra == "a2" else derivation_algebra("octonion")
+    f = lie.to_dense()
+    np.testing.assert_allclose(lie.killing_form().toarray(), np.einsum("aik,bki->ab", f, f), atol=1e-10)
+    assert lie.is_semisimple()
+
+@pytest.mark.parametrize("algebra", ["a2", "g2"])
+def test_casimir_is_identity_on_adjoint(algebra, a2):
+    lie = a2 if algebra == "a2" else derivation_algebra("octonion")
+    np.testing.assert_allclose(lie.casimir(), np.eye(lie.dim), atol=1e-10)
+
+def test_cache_round_trip(algebra_cache):
+    path = os.path.join(algebra_cache, f"tits_real_complex_v{CACHE_VERSION}.npz")
+    built = tits_algebra("real", "complex")  # builds and saves unless an earlier test already did
+    assert os.path.exists(path)
+    loaded = tits_algebra("real", "complex")
+    fresh = build_tits_algebra("real", "complex")
+    for alg in (built, loaded):
+        assert (alg.name, alg.dim) == (fresh.name, fresh.dim)
+        np.testing.assert_array_equal(alg.coords, fresh.coords)
+        np.testing.assert_array_equal(alg.values, fresh.values)
+
+def test_stale_cache_version_raises(tmp_path, monkeypatch, a2):
+    path = str(tmp_path / "stale.npz")
+    np.savez_compressed(path, version=CACHE_VERSION - 1, name=a2.name, dim=a2.dim, coords=a2.coords, values=a2.values)
+    with pytest.raises(ValueError, match="Stale"):
+        StructureConstants.load(path)
+    monkeypatch.setenv("QMH7_CACHE_DIR", str(tmp_path))
+    os.replace(path, tmp_path / f"tits_real_complex_v{CACHE_VERSION}.npz")
+    with pytest.raises(ValueError, match="Stale"):
+        tits_algebra("real", "complex")